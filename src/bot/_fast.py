@@ -0,0 +1,146 @@
+"""JIT-compiled numeric core for the strategy indicators.
+
+When numba is installed the fused EMA + true-range pass compiles to
+native code on first call and is disk-cached, so the per-product candle
+walk costs one machine-code loop instead of Python bytecode. Without
+numba the same function runs as-is over the NumPy arrays, identical to
+the previous pure-Python implementation.
+"""
+
+import os
+
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; fall back to the plain function
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def fused_indicators(highs, lows, closes, ema_short_p, ema_long_p):
+    """Both EMAs and the true-range series in a single pass over the candles.
+
+    Returns (ema_short, ema_long, trs); EMAs are NaN when the series is
+    shorter than the period, mirroring compute_ema returning None.
+    """
+    n = closes.shape[0]
+    trs = np.empty(max(n - 1, 0), dtype=np.float64)
+    if n == 0:
+        return np.nan, np.nan, trs
+
+    mult_s = 2.0 / (ema_short_p + 1.0)
+    mult_l = 2.0 / (ema_long_p + 1.0)
+    ema_s = closes[0]
+    ema_l = closes[0]
+    for i in range(1, n):
+        close = closes[i]
+        ema_s = (close - ema_s) * mult_s + ema_s
+        ema_l = (close - ema_l) * mult_l + ema_l
+        tr = highs[i] - lows[i]
+        hc = abs(highs[i] - closes[i - 1])
+        if hc > tr:
+            tr = hc
+        lc = abs(lows[i] - closes[i - 1])
+        if lc > tr:
+            tr = lc
+        trs[i - 1] = tr
+
+    if n < ema_short_p:
+        ema_s = np.nan
+    if n < ema_long_p:
+        ema_l = np.nan
+    return ema_s, ema_l, trs
+
+
+@njit(cache=True)
+def fill_grid(body_tops, body_bots, wick_tops, wick_bots, bullish, char_out, style_out):
+    """Fill the candlestick grid as uint8 char/style codes.
+
+    Char codes: 0=space, 1=wick, 2=doji, 3=bull body, 4=bear body.
+    Style codes: 0=white, 1=green, 2=red, 3=bold green, 4=bold red.
+    The caller translates codes to characters and Rich styles once at
+    render time.
+    """
+    n = body_tops.shape[0]
+    for col in range(n):
+        color = 1 if bullish[col] else 2
+        body_top = body_tops[col]
+        body_bot = body_bots[col]
+
+        for row in range(wick_tops[col], body_top):
+            char_out[row, col] = 1
+            style_out[row, col] = color
+
+        if body_top == body_bot:
+            char_out[body_top, col] = 2
+            style_out[body_top, col] = color
+        elif bullish[col]:
+            for row in range(body_top, body_bot + 1):
+                char_out[row, col] = 3
+                style_out[row, col] = 3
+        else:
+            for row in range(body_top, body_bot + 1):
+                char_out[row, col] = 4
+                style_out[row, col] = color
+
+        for row in range(body_bot + 1, wick_bots[col] + 1):
+            char_out[row, col] = 1
+            style_out[row, col] = color
+
+
+def _fill_grid_numpy(body_tops, body_bots, wick_tops, wick_bots, bullish, char_out, style_out):
+    """Slice-fill variant of fill_grid for when numba is absent.
+
+    Each wick/body segment is one C-level column-slice assignment instead
+    of a Python loop per cell.
+    """
+    n = body_tops.shape[0]
+    for col in range(n):
+        color = 1 if bullish[col] else 2
+        body_top = int(body_tops[col])
+        body_bot = int(body_bots[col])
+
+        char_out[wick_tops[col]:body_top, col] = 1
+        style_out[wick_tops[col]:body_top, col] = color
+
+        if body_top == body_bot:
+            char_out[body_top, col] = 2
+            style_out[body_top, col] = color
+        elif bullish[col]:
+            char_out[body_top:body_bot + 1, col] = 3
+            style_out[body_top:body_bot + 1, col] = 3
+        else:
+            char_out[body_top:body_bot + 1, col] = 4
+            style_out[body_top:body_bot + 1, col] = color
+
+        char_out[body_bot + 1:wick_bots[col] + 1, col] = 1
+        style_out[body_bot + 1:wick_bots[col] + 1, col] = color
+
+
+if not _HAVE_NUMBA:
+    fill_grid = _fill_grid_numpy
+
+
+def _warmup():
+    """Trigger compilation (or load the on-disk cache) at import so the
+    first real tick doesn't stall on LLVM. Shapes only need to match the
+    functions' dimensionality, not production sizes."""
+    series = np.zeros(4, dtype=np.float64)
+    fused_indicators(series, series, series, 2, 3)
+
+    rows = np.zeros(2, dtype=np.int32)
+    fill_grid(rows, rows, rows, rows, np.zeros(2, dtype=np.bool_),
+              np.zeros((4, 2), dtype=np.uint8), np.zeros((4, 2), dtype=np.uint8))
+
+
+if _HAVE_NUMBA and os.getenv("BOT_NUMBA_WARMUP", "1") == "1":
+    _warmup()
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import random
 import signal
 import time
 from datetime import datetime
@@ -6,219 +8,421 @@ from decimal import Decimal, ROUND_DOWN
 
 from src.bot.strategy import (
     CancelRebuyAction,
+    CandleBundle,
     NoAction,
     RebuyAction,
     SellAction,
-    detect_trend,
+    build_candle_bundle,
 )
-from src.coinbase.client import CoinbaseAPIError, CoinbaseClient
+from src.coinbase.async_client import AsyncCoinbaseClient
+from src.coinbase.client import CoinbaseAPIError
+from src.coinbase.ws import TickerFeed
 from src.config import LOOP_INTERVAL, PRODUCTS
-from src.storage.db import StateDB
+from src.storage.db import ProductState, StateDB
 
 logger = logging.getLogger(__name__)
 
+# Ignore quote updates whose mid moved less than this fraction since the
+# last processed tick — keeps the event loop from re-evaluating on noise
+MIN_PRICE_MOVE = Decimal("0.0001")
+
+# Decimal constants hoisted to import time so the hot path never
+# re-allocates them per call
+_Q_SIZE = Decimal("0.00000001")  # base size precision (8 dp)
+_Q_PRICE = Decimal("0.01")       # quote price precision
+_FEE_RATE = Decimal("0.006")
+_TWO = Decimal(2)
+_ZERO = Decimal(0)
+
+# Reconcile runs often so fresh fills are noticed quickly, but each open
+# rebuy is polled with jittered exponential backoff the longer it sits
+RECONCILE_INTERVAL = 5
+CHECKPOINT_INTERVAL = 60
+RECONCILE_BACKOFF_BASE = 2.0
+RECONCILE_BACKOFF_MAX = 300.0
+
+# Balances only change on fills, so cache them and invalidate on order
+# activity; the TTL is just a safety net against missed fills
+BALANCE_TTL = 60.0
+
 
 class BotRunner:
     def __init__(
-        self, client: CoinbaseClient, db: StateDB, strategy, products: list[str] = None, dry_run: bool = False
+        self, client: AsyncCoinbaseClient, db: StateDB, strategy, products: list[str] = None, dry_run: bool = False
     ):
         self.client = client
         self.db = db
         self.strategy = strategy
         self.products = products or PRODUCTS
         self.dry_run = dry_run
-        self._running = True
-
-        signal.signal(signal.SIGINT, self._handle_signal)
-        signal.signal(signal.SIGTERM, self._handle_signal)
-
-    def _handle_signal(self, signum, frame):
+        self._events: asyncio.Queue = asyncio.Queue()
+        self.feed = TickerFeed(self.products, events=self._events)
+        self._candle_cache: dict[str, tuple[int, CandleBundle]] = {}
+        self._last_mid: dict[str, Decimal] = {}
+        self._balance_cache: dict[str, tuple[float, Decimal]] = {}
+        self._next_reconcile_at: dict[str, float] = {}
+        self._reconcile_attempts: dict[str, int] = {}
+        # Quote events, the periodic tick and reconcile can all target
+        # the same product concurrently; one lock per product keeps a
+        # tick's read-evaluate-write sequence from interleaving with
+        # another's (overlapping ticks would double-place orders)
+        self._product_locks: dict[str, asyncio.Lock] = {}
+        # Single stop event instead of a polled flag: sleeps wake the
+        # moment a signal arrives rather than on the next 1s check
+        self._stop = asyncio.Event()
+
+    def _handle_signal(self, signum, frame=None):
         logger.info("Received signal %d, shutting down gracefully...", signum)
-        self._running = False
+        self._stop.set()
 
-    def reconcile(self):
-        logger.info("Reconciling state with exchange...")
+    def _install_signal_handlers(self):
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._handle_signal, sig)
+            except NotImplementedError:
+                # Event loops without signal support (e.g. Windows)
+                signal.signal(sig, self._handle_signal)
+
+    def _schedule_reconcile_backoff(self, product_id: str, now: float):
+        attempt = self._reconcile_attempts.get(product_id, 0)
+        wait = min(RECONCILE_BACKOFF_MAX, RECONCILE_BACKOFF_BASE * (2 ** attempt))
+        self._next_reconcile_at[product_id] = now + wait + random.uniform(0, RECONCILE_BACKOFF_BASE)
+        self._reconcile_attempts[product_id] = attempt + 1
+
+    def _clear_reconcile_backoff(self, product_id: str):
+        self._next_reconcile_at.pop(product_id, None)
+        self._reconcile_attempts.pop(product_id, None)
+
+    async def reconcile(self):
+        logger.debug("Reconciling state with exchange...")
+        now = time.time()
+
+        # Collect every open rebuy that is due for a check, then resolve
+        # them all with one batched order lookup instead of N GETs
+        pending: list[tuple[str, object]] = []
+        order_ids: list[str] = []
         for product_id in self.products:
-            state = self.db.get_product_state(product_id)
-            if state is None or not state.get("rebuy_order_id"):
+            if self._next_reconcile_at.get(product_id, 0) > now:
+                continue  # Backing off: this rebuy was still open recently
+
+            state = self.db.get_rebuy_fields(product_id)
+            if state is None or not state["rebuy_order_id"]:
+                self._clear_reconcile_backoff(product_id)
                 continue
 
             order_id = state["rebuy_order_id"]
             if order_id.startswith("dry-run-"):
                 logger.info("%s | Clearing dry-run rebuy order %s", product_id, order_id)
-                self.db.clear_rebuy_order(product_id)
+                self.db.clear_rebuy_order(product_id, now=now)
+                self._clear_reconcile_backoff(product_id)
                 continue
 
+            pending.append((product_id, state))
+            order_ids.append(order_id)
+
+        if not pending:
+            logger.debug("Reconciliation complete")
+            return
+
+        try:
+            orders = await self.client.get_orders(order_ids)
+        except CoinbaseAPIError as e:
+            logger.warning("Batch order lookup failed: %s", e)
+            for product_id, _ in pending:
+                self._schedule_reconcile_backoff(product_id, now)
+            return
+
+        for product_id, state in pending:
+            lock = self._product_locks.setdefault(product_id, asyncio.Lock())
+            if lock.locked():
+                # A tick holds this product mid-flight; the next pass
+                # (5s away) will pick the order up again
+                continue
+            async with lock:
+                try:
+                    self._apply_order_status(product_id, state, orders.get(state["rebuy_order_id"]), now)
+                except Exception:
+                    logger.exception("%s | Reconcile failed", product_id)
+        logger.debug("Reconciliation complete")
+
+    def _apply_order_status(self, product_id: str, state, order: dict | None, now: float):
+        order_id = state["rebuy_order_id"]
+        if order is None:
+            logger.warning("%s | Rebuy order %s missing from batch lookup", product_id, order_id)
+            self._schedule_reconcile_backoff(product_id, now)
+            return
+
+        status = order.get("status", "UNKNOWN")
+        logger.debug("%s | Rebuy order %s status: %s", product_id, order_id, status)
+
+        if status in ("FILLED", "COMPLETED"):
+            fill_price = Decimal(order.get("average_filled_price") or state["rebuy_price"] or "0")
+            fill_size = Decimal(order.get("filled_size") or state["rebuy_size"] or "0")
+            fee = Decimal(order.get("total_fees", "0"))
+
+            # Update anchor to blended average
+            old_anchor = Decimal(state["anchor_price"] or "0")
+            if old_anchor > 0:
+                new_anchor = (old_anchor + fill_price) / _TWO
+            else:
+                new_anchor = fill_price
+            self.db.apply_buy_fill(
+                product_id, order_id=order_id, price=fill_price, size=fill_size,
+                quote_total=fill_price * fill_size, fee=fee,
+                reason="rebuy_filled_on_reconcile", anchor_price=new_anchor, now=now,
+            )
+            self._clear_reconcile_backoff(product_id)
+            self._invalidate_balances(product_id)
+            logger.info("%s | Rebuy filled at %s, new anchor %s", product_id, fill_price, new_anchor)
+
+        elif status in ("CANCELLED", "EXPIRED", "FAILED"):
+            self.db.clear_rebuy_order(product_id, now=now)
+            self._clear_reconcile_backoff(product_id)
+            logger.info("%s | Rebuy order %s was %s, cleared", product_id, order_id, status)
+
+        else:
+            # OPEN/PENDING → leave as-is, widen the next check
+            self._schedule_reconcile_backoff(product_id, now)
+
+    async def _tick_all(self):
+        # One batched bid/ask call covers every product the feed cannot
+        # serve, then fan out so the remaining round-trips overlap
+        books = await self._fetch_books()
+        tasks = [self._process_product(pid, book=books.get(pid)) for pid in self.products]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for product_id, result in zip(self.products, results):
+            if isinstance(result, Exception):
+                logger.error("%s | Error processing product: %s", product_id, result)
+
+    async def _periodic(self, interval: float, func):
+        while not self._stop.is_set():
+            # Interruptible sleep: wakes immediately when the stop event
+            # is set instead of finishing the interval first
             try:
-                resp = self.client.get_order(order_id)
-                order = resp.get("order", resp)
-                status = order.get("status", "UNKNOWN")
-                logger.info("%s | Rebuy order %s status: %s", product_id, order_id, status)
-
-                if status in ("FILLED", "COMPLETED"):
-                    fill_price = Decimal(order.get("average_filled_price", state.get("rebuy_price", "0")))
-                    fill_size = Decimal(order.get("filled_size", state.get("rebuy_size", "0")))
-                    fee = Decimal(order.get("total_fees", "0"))
-
-                    self.db.record_trade(
-                        product_id=product_id, side="BUY", order_type="limit",
-                        order_id=order_id, price=fill_price, size=fill_size,
-                        quote_total=fill_price * fill_size, fee=fee,
-                        reason="rebuy_filled_on_reconcile",
-                    )
-                    # Update anchor to blended average
-                    old_anchor = Decimal(state.get("anchor_price", "0"))
-                    if old_anchor > 0:
-                        new_anchor = (old_anchor + fill_price) / Decimal(2)
-                    else:
-                        new_anchor = fill_price
-                    self.db.upsert_product_state(product_id, anchor_price=str(new_anchor))
-                    self.db.clear_rebuy_order(product_id)
-                    self.db.increment_daily_trades(product_id)
-                    logger.info("%s | Rebuy filled at %s, new anchor %s", product_id, fill_price, new_anchor)
-
-                elif status in ("CANCELLED", "EXPIRED", "FAILED"):
-                    self.db.clear_rebuy_order(product_id)
-                    logger.info("%s | Rebuy order %s was %s, cleared", product_id, order_id, status)
-
-                # OPEN/PENDING → leave as-is
-
-            except CoinbaseAPIError as e:
-                logger.warning("%s | Failed to check rebuy order %s: %s", product_id, order_id, e)
-
-        logger.info("Reconciliation complete")
-
-    def run_loop(self, once: bool = False):
-        self.reconcile()
-
-        while self._running:
-            for product_id in self.products:
-                if not self._running:
+                await asyncio.wait_for(self._stop.wait(), timeout=interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await func()
+            except Exception:
+                logger.exception("Periodic task %s failed", getattr(func, "__name__", func))
+
+    async def _checkpoint_db(self):
+        # PASSIVE never waits on readers; a 60s cadence keeps the WAL
+        # small so no single commit ever absorbs the flush
+        self.db.checkpoint()
+
+    async def run_loop(self, once: bool = False):
+        self._install_signal_handlers()
+        self.feed.start()
+        await self.reconcile()
+        await self._tick_all()
+
+        if not once:
+            # Quote events drive per-product evaluation; the coarse timers
+            # cover candle refresh, reconcile, and WS outages
+            background = [
+                asyncio.create_task(self._periodic(LOOP_INTERVAL, self._tick_all)),
+                asyncio.create_task(self._periodic(RECONCILE_INTERVAL, self.reconcile)),
+                asyncio.create_task(self._periodic(CHECKPOINT_INTERVAL, self._checkpoint_db)),
+            ]
+
+            stop_task = asyncio.create_task(self._stop.wait())
+            while not self._stop.is_set():
+                get_task = asyncio.create_task(self._events.get())
+                done, _ = await asyncio.wait(
+                    {get_task, stop_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if get_task not in done:
+                    get_task.cancel()
                     break
+                product_id, bid, ask = get_task.result()
+
+                mid = (bid + ask) / _TWO
+                last = self._last_mid.get(product_id)
+                if last is not None and last > 0 and abs(mid - last) / last < MIN_PRICE_MOVE:
+                    continue
+                self._last_mid[product_id] = mid
+
                 try:
-                    self._process_product(product_id)
+                    await self._process_product(product_id)
                 except Exception:
                     logger.exception("%s | Error processing product", product_id)
 
-            if once:
-                break
-
-            logger.debug("Sleeping %ds...", LOOP_INTERVAL)
-            # Sleep in small increments for responsive shutdown
-            for _ in range(LOOP_INTERVAL):
-                if not self._running:
-                    break
-                time.sleep(1)
+            stop_task.cancel()
+            for task in background:
+                task.cancel()
+            await asyncio.gather(stop_task, *background, return_exceptions=True)
 
+        await self.feed.stop()
+        await self.client.close()
         logger.info("Bot loop ended")
 
-    def _process_product(self, product_id: str):
-        # Fetch current price
-        bid_ask = self.client.get_best_bid_ask([product_id])
-        pricebooks = bid_ask.get("pricebooks", [])
-        if not pricebooks:
-            logger.warning("%s | No price data", product_id)
-            return
-
-        book = pricebooks[0]
+    async def _fetch_books(self) -> dict[str, dict]:
+        # Products with a fresh WebSocket quote do not need REST at all;
+        # the rest share a single batched best_bid_ask request
+        missing = [pid for pid in self.products if self.feed.get(pid) is None]
+        if not missing:
+            return {}
+        try:
+            resp = await self.client.get_best_bid_ask(missing)
+        except CoinbaseAPIError as e:
+            logger.warning("Batched bid/ask fetch failed: %s", e)
+            return {}
+        return {b["product_id"]: b for b in resp.get("pricebooks", [])}
+
+    async def _fetch_bid_ask(
+        self, product_id: str, book: dict | None = None
+    ) -> tuple[Decimal | None, Decimal | None]:
+        # Prefer the pushed WebSocket quote; hit REST only when it is stale
+        cached = self.feed.get(product_id)
+        if cached is not None:
+            return cached[0], cached[1]
+
+        if book is None:
+            bid_ask = await self.client.get_best_bid_ask([product_id])
+            pricebooks = bid_ask.get("pricebooks", [])
+            if not pricebooks:
+                return None, None
+            book = pricebooks[0]
         best_bid = Decimal(book["bids"][0]["price"]) if book.get("bids") else None
         best_ask = Decimal(book["asks"][0]["price"]) if book.get("asks") else None
-        if best_bid is None or best_ask is None:
-            logger.warning("%s | Incomplete bid/ask", product_id)
+        return best_bid, best_ask
+
+    async def _get_balance(self, currency: str) -> Decimal:
+        cached = self._balance_cache.get(currency)
+        now = time.time()
+        if cached is not None and now - cached[0] < BALANCE_TTL:
+            return cached[1]
+        balance = await self.client.get_balance(currency)
+        self._balance_cache[currency] = (now, balance)
+        return balance
+
+    def _invalidate_balances(self, product_id: str):
+        base, quote = product_id.split("-")
+        self._balance_cache.pop(base, None)
+        self._balance_cache.pop(quote, None)
+
+    async def _get_candles(self, product_id: str) -> CandleBundle:
+        # Hourly candles only change when the hour bucket rolls over, so
+        # refetch (and sort/parse) at most once per hour instead of every
+        # loop iteration
+        hour = int(time.time()) // 3600
+        cached = self._candle_cache.get(product_id)
+        if cached is not None and cached[0] == hour:
+            return cached[1]
+        candles = await self.client.get_candles(product_id, "ONE_HOUR", 50)
+        bundle = build_candle_bundle(candles)
+        self._candle_cache[product_id] = (hour, bundle)
+        return bundle
+
+    async def _process_product(self, product_id: str, book: dict | None = None):
+        lock = self._product_locks.setdefault(product_id, asyncio.Lock())
+        if lock.locked():
+            # Skip rather than queue: a queued tick would evaluate the
+            # same quote against state the in-flight tick is about to
+            # change, and re-emit its actions
+            logger.debug("%s | Tick already in flight, skipping", product_id)
             return
-        mid_price = (best_bid + best_ask) / Decimal(2)
-
-        # Fetch candles
-        candles = self.client.get_candles(product_id, "ONE_HOUR", 50)
+        async with lock:
+            await self._process_product_locked(product_id, book=book)
 
-        # Fetch balances
+    async def _process_product_locked(self, product_id: str, book: dict | None = None):
         base_currency = product_id.split("-")[0]
         quote_currency = product_id.split("-")[1]
-        base_balance = self.client.get_balance(base_currency)
-        quote_balance = self.client.get_balance(quote_currency)
+
+        # Fetch price, candles and balances concurrently
+        (best_bid, best_ask), bundle, base_balance, quote_balance = await asyncio.gather(
+            self._fetch_bid_ask(product_id, book=book),
+            self._get_candles(product_id),
+            self._get_balance(base_currency),
+            self._get_balance(quote_currency),
+        )
+
+        if best_bid is None or best_ask is None:
+            logger.warning("%s | Incomplete bid/ask", product_id)
+            return
+        mid_price = (best_bid + best_ask) / _TWO
 
         # Load state
-        state = self.db.get_product_state(product_id)
+        state = self.db.get_product_state_typed(product_id)
         daily_count = self.db.get_daily_trade_count(product_id)
 
         # Initialize anchor if needed
-        if state is None or not state.get("anchor_price"):
-            self.db.upsert_product_state(product_id, anchor_price=str(mid_price), avg_entry_price=str(mid_price))
-            state = self.db.get_product_state(product_id)
+        if state is None or state.anchor_price is None:
+            self.db.upsert_product_state(product_id, anchor_price=mid_price, avg_entry_price=mid_price)
+            state = self.db.get_product_state_typed(product_id)
             logger.info("%s | Initialized anchor price at %s", product_id, mid_price)
 
         # Evaluate strategy
-        actions = self.strategy.evaluate(
+        actions, ctx = self.strategy.evaluate(
             product_id=product_id,
             current_price=mid_price,
             state=state,
             base_balance=base_balance,
             quote_balance=quote_balance,
-            candles=candles,
+            candles=bundle,
             daily_trade_count=daily_count,
         )
 
-        # Detect trend for logging
-        sorted_candles = sorted(candles, key=lambda c: int(c.get("start", 0)))
-        closes = [Decimal(c["close"]) for c in sorted_candles]
-        trend = detect_trend(closes)
-        anchor = state.get("anchor_price", "N/A") if state else "N/A"
-        rebuy_id = state.get("rebuy_order_id", "none") if state else "none"
-
         action_strs = []
         for action in actions:
-            result = self._execute_action(product_id, action, state)
+            result = await self._execute_action(product_id, action, state)
             action_strs.append(result)
 
-        logger.info(
-            "%s | price=%s | bid=%s ask=%s | base=%s quote=%s | anchor=%s | trend=%s | "
-            "tp_band=%s | rebuy=%s | trades=%d | actions=[%s]",
-            product_id, mid_price, best_bid, best_ask,
-            base_balance, quote_balance, anchor, trend.value,
-            state.get("last_tp_band", 0) if state else 0,
-            rebuy_id, daily_count,
-            ", ".join(action_strs),
-        )
+        # Trend comes back from evaluate — no recomputation for logging
+        if logger.isEnabledFor(logging.INFO):
+            anchor = state.anchor_price if state and state.anchor_price is not None else "N/A"
+            rebuy_id = state.rebuy_order_id if state and state.rebuy_order_id else "none"
+            logger.info(
+                "%s | price=%s | bid=%s ask=%s | base=%s quote=%s | anchor=%s | trend=%s | "
+                "tp_band=%s | rebuy=%s | trades=%d | actions=[%s]",
+                product_id, mid_price, best_bid, best_ask,
+                base_balance, quote_balance, anchor, ctx.trend.value,
+                state.last_tp_band if state else 0,
+                rebuy_id, daily_count,
+                ", ".join(action_strs),
+            )
 
-    def _execute_action(self, product_id: str, action, state: dict | None) -> str:
+    async def _execute_action(self, product_id: str, action, state: ProductState | None) -> str:
         if isinstance(action, SellAction):
-            return self._execute_sell(product_id, action, state)
+            return await self._execute_sell(product_id, action, state)
         elif isinstance(action, RebuyAction):
-            return self._execute_rebuy(product_id, action)
+            return await self._execute_rebuy(product_id, action)
         elif isinstance(action, CancelRebuyAction):
-            return self._execute_cancel(product_id, action)
+            return await self._execute_cancel(product_id, action)
         elif isinstance(action, NoAction):
             logger.debug("%s | No action: %s", product_id, action.reason)
             return f"no_action:{action.reason}"
         return "unknown_action"
 
-    def _execute_sell(self, product_id: str, action: SellAction, state: dict | None) -> str:
+    async def _execute_sell(self, product_id: str, action: SellAction, state: ProductState | None) -> str:
         # Round base_size down to 8 decimal places
-        size_str = str(action.base_size.quantize(Decimal("0.00000001"), rounding=ROUND_DOWN))
+        size_str = str(action.base_size.quantize(_Q_SIZE, rounding=ROUND_DOWN))
 
         try:
-            resp = self.client.create_market_order(product_id, "SELL", base_size=size_str)
+            resp = await self.client.create_market_order(product_id, "SELL", base_size=size_str)
             order_id = resp.get("success_response", {}).get("order_id", resp.get("order_id", "unknown"))
 
             # Estimate fill for recording
-            bid_ask = self.client.get_best_bid_ask([product_id])
-            price_est = Decimal("0")
+            bid_ask = await self.client.get_best_bid_ask([product_id])
+            price_est = _ZERO
             pricebooks = bid_ask.get("pricebooks", [])
             if pricebooks and pricebooks[0].get("bids"):
                 price_est = Decimal(pricebooks[0]["bids"][0]["price"])
 
             quote_total = action.base_size * price_est
-            fee_est = quote_total * Decimal("0.006")
+            fee_est = quote_total * _FEE_RATE
 
-            self.db.record_trade(
-                product_id=product_id, side="SELL", order_type="market",
-                order_id=order_id, price=price_est, size=action.base_size,
+            now = time.time()
+            self.db.apply_sell_fill(
+                product_id, order_id=order_id, price=price_est, size=action.base_size,
                 quote_total=quote_total, fee=fee_est, reason=action.reason,
+                band_index=action.band_index, tp_timestamp=now, now=now,
             )
-            self.db.upsert_product_state(
-                product_id, last_tp_band=action.band_index, last_tp_timestamp=time.time()
-            )
-            self.db.increment_daily_trades(product_id)
+            self._invalidate_balances(product_id)
 
             logger.info("%s | SELL %s @ ~%s | reason=%s", product_id, size_str, price_est, action.reason)
             return f"sell:{size_str}@~{price_est}"
@@ -227,18 +431,23 @@ class BotRunner:
             logger.error("%s | Sell failed: %s", product_id, e)
             return f"sell_error:{e}"
 
-    def _execute_rebuy(self, product_id: str, action: RebuyAction) -> str:
+    async def _execute_rebuy(self, product_id: str, action: RebuyAction) -> str:
         # Round appropriately
-        price_str = str(action.limit_price.quantize(Decimal("0.01"), rounding=ROUND_DOWN))
-        size_str = str(action.base_size.quantize(Decimal("0.00000001"), rounding=ROUND_DOWN))
+        price_str = str(action.limit_price.quantize(_Q_PRICE, rounding=ROUND_DOWN))
+        size_str = str(action.base_size.quantize(_Q_SIZE, rounding=ROUND_DOWN))
 
         try:
-            resp = self.client.create_limit_order(
+            resp = await self.client.create_limit_order(
                 product_id, "BUY", base_size=size_str, limit_price=price_str, post_only=True
             )
             order_id = resp.get("success_response", {}).get("order_id", resp.get("order_id", "unknown"))
 
-            self.db.set_rebuy_order(product_id, order_id, action.limit_price, action.base_size)
+            now = time.time()
+            self.db.set_rebuy_order(product_id, order_id, action.limit_price, action.base_size, now=now)
+            # Check the fresh order almost immediately, then back off
+            self._next_reconcile_at[product_id] = now + 1
+            self._reconcile_attempts[product_id] = 0
+            self._invalidate_balances(product_id)
 
             logger.info(
                 "%s | REBUY limit %s @ %s | reason=%s",
@@ -250,14 +459,14 @@ class BotRunner:
             logger.error("%s | Rebuy failed: %s", product_id, e)
             return f"rebuy_error:{e}"
 
-    def _execute_cancel(self, product_id: str, action: CancelRebuyAction) -> str:
+    async def _execute_cancel(self, product_id: str, action: CancelRebuyAction) -> str:
         if action.order_id.startswith("dry-run-"):
             self.db.clear_rebuy_order(product_id)
             logger.info("%s | Cleared dry-run rebuy: %s", product_id, action.reason)
             return f"cancel_dry_run:{action.reason}"
 
         try:
-            self.client.cancel_orders([action.order_id])
+            await self.client.cancel_orders([action.order_id])
             self.db.clear_rebuy_order(product_id)
             logger.info("%s | Cancelled rebuy %s: %s", product_id, action.order_id, action.reason)
             return f"cancel:{action.reason}"
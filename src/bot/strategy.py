@@ -1,9 +1,15 @@
+import bisect
 import logging
 import time
+from collections import deque
+from operator import itemgetter
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
 
+import numpy as np
+
+from src.bot._fast import fused_indicators
 from src.config import (
     ATR_PERIOD,
     COOLDOWN_SECONDS,
@@ -20,6 +26,7 @@ from src.config import (
     TP_LADDER,
     TREND_THRESHOLD,
 )
+from src.storage.db import ProductState
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +37,67 @@ class Trend(Enum):
     SIDEWAYS = "SIDEWAYS"
 
 
+# Fixed-point representation for hot-path arithmetic: prices, sizes and
+# ratios are ints scaled by 1e8, so the per-tick comparisons and products
+# run on native machine ints instead of Decimal. Decimal survives only at
+# the boundaries — DB strings coming in, order sizes/prices going out.
+SCALE = 10 ** 8
+
+
+def to_fp(value) -> int:
+    return int(Decimal(value) * SCALE)
+
+
+def from_fp(value: int) -> Decimal:
+    return Decimal(value) / SCALE
+
+
+def _fp_mul(a: int, b: int) -> int:
+    return a * b // SCALE
+
+
+def _fp_div(a: int, b: int) -> int:
+    return a * SCALE // b
+
+
+# Strategy constants pre-converted to fixed point once at import.
+# The TP thresholds are monotonic, so the highest band crossed by a given
+# gain can be found with bisect instead of scanning the ladder.
+_TP_LADDER_FP = [(to_fp(threshold), to_fp(fraction)) for threshold, fraction in TP_LADDER]
+_TP_THRESHOLDS_FP = [threshold for threshold, _ in _TP_LADDER_FP]
+_TP_FRACTIONS_FP = [fraction for _, fraction in _TP_LADDER_FP]
+_MIN_NOTIONAL_FP = to_fp(MIN_NOTIONAL)
+_REBUY_MIN_DISTANCE_FP = to_fp(REBUY_MIN_DISTANCE)
+_REBUY_ATR_MULTIPLIER_FP = to_fp(REBUY_ATR_MULTIPLIER)
+_REBUY_DOWNTREND_MULTIPLIER_FP = to_fp(REBUY_DOWNTREND_MULTIPLIER)
+_REBUY_DRIFT_THRESHOLD_FP = to_fp(REBUY_DRIFT_THRESHOLD)
+_ROUND_TRIP_FEE_FP = to_fp(ESTIMATED_FEE_RATE * Decimal(2))
+_REBUY_QUOTE_FRACTION_FP = to_fp(Decimal("0.2"))
+
+
+@dataclass
+class CandleBundle:
+    """Candles sorted once at fetch time plus the derived close series.
+
+    Built when the candle cache rolls over so neither the runner nor the
+    strategy re-sorts or re-parses the same 50 candles every tick.
+    """
+    sorted_candles: list[dict]
+    closes: list[Decimal]
+    closes_f64: np.ndarray
+
+
+def build_candle_bundle(candles: list[dict]) -> CandleBundle:
+    # get_candles already normalizes start to int, so this is a cheap
+    # no-op pass on pre-sorted input (itemgetter is a C-level key fn)
+    sorted_candles = sorted(candles, key=itemgetter("start"))
+    closes = [Decimal(c["close"]) for c in sorted_candles]
+    closes_f64 = np.fromiter(
+        (float(c["close"]) for c in sorted_candles), dtype=np.float64, count=len(sorted_candles)
+    )
+    return CandleBundle(sorted_candles=sorted_candles, closes=closes, closes_f64=closes_f64)
+
+
 @dataclass
 class SellAction:
     product_id: str
@@ -59,6 +127,15 @@ class NoAction:
     reason: str
 
 
+@dataclass(slots=True)
+class EvalContext:
+    """Indicator values computed during evaluate, handed back to the runner
+    so logging never recomputes trend/ATR from the candles."""
+    trend: Trend
+    atr: Decimal | None
+    gain: float
+
+
 def compute_ema(closes: list[Decimal], period: int) -> Decimal | None:
     if len(closes) < period:
         return None
@@ -86,6 +163,33 @@ def compute_atr(candles: list[dict], period: int = ATR_PERIOD) -> Decimal | None
     return sum(recent) / Decimal(len(recent))
 
 
+_TREND_THRESHOLD_F = float(TREND_THRESHOLD)
+
+
+def indicators_f64(
+    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray
+) -> tuple[Trend, float | None]:
+    """Trend and ATR from float64 arrays via the fused JIT pass.
+
+    Float counterpart of detect_trend + compute_atr for callers that only
+    display the results (the dashboard) and never trade on them.
+    """
+    ema_s, ema_l, trs = fused_indicators(highs, lows, closes, EMA_SHORT, EMA_LONG)
+    if np.isnan(ema_s) or np.isnan(ema_l):
+        trend = Trend.SIDEWAYS
+    else:
+        spread = (ema_s - ema_l) / ema_l
+        if spread > _TREND_THRESHOLD_F:
+            trend = Trend.UPTREND
+        elif spread < -_TREND_THRESHOLD_F:
+            trend = Trend.DOWNTREND
+        else:
+            trend = Trend.SIDEWAYS
+
+    atr = float(trs[-ATR_PERIOD:].mean()) if trs.shape[0] >= ATR_PERIOD else None
+    return trend, atr
+
+
 def detect_trend(closes: list[Decimal]) -> Trend:
     ema_short = compute_ema(closes, EMA_SHORT)
     ema_long = compute_ema(closes, EMA_LONG)
@@ -100,41 +204,102 @@ def detect_trend(closes: list[Decimal]) -> Trend:
 
 
 class Strategy:
+    def __init__(self):
+        # Cached indicator state per product, keyed by the newest candle
+        # bucket: the bundle only changes once per bar, so most ticks
+        # reuse the previous fused-pass result instead of re-walking
+        # 50 candles of Decimal arithmetic every loop.
+        self._last_bar: dict[str, int] = {}
+        self._ema_state: dict[tuple[str, int], Decimal | None] = {}
+        self._atr_window: dict[str, deque] = {}
+
+    def _recompute_indicators(self, product_id: str, bundle: CandleBundle):
+        # Cold path runs over float64 arrays instead of Decimal lists —
+        # results cross back to Decimal at the boundary so the incremental
+        # updates and downstream comparisons stay in exact arithmetic
+        sorted_candles = bundle.sorted_candles
+        n = len(sorted_candles)
+        closes_f = bundle.closes_f64
+        highs = np.fromiter((float(c["high"]) for c in sorted_candles), dtype=np.float64, count=n)
+        lows = np.fromiter((float(c["low"]) for c in sorted_candles), dtype=np.float64, count=n)
+
+        ema_s, ema_l, trs = fused_indicators(highs, lows, closes_f, EMA_SHORT, EMA_LONG)
+        self._ema_state[(product_id, EMA_SHORT)] = Decimal(str(ema_s)) if not np.isnan(ema_s) else None
+        self._ema_state[(product_id, EMA_LONG)] = Decimal(str(ema_l)) if not np.isnan(ema_l) else None
+        self._atr_window[product_id] = deque(
+            (Decimal(str(tr)) for tr in trs[-ATR_PERIOD:]), maxlen=ATR_PERIOD
+        )
+
+    def _indicators(self, product_id: str, bundle: CandleBundle) -> tuple[Trend, Decimal | None]:
+        """Trend and ATR for a product, recomputed once per new bar."""
+        sorted_candles = bundle.sorted_candles
+        if len(sorted_candles) < 2:
+            return Trend.SIDEWAYS, None
+
+        # Recompute on any bundle change. An O(1) per-bar advance is
+        # tempting but folds in the newest bar, which is freshly opened
+        # (high=low=close=open) when the bundle is fetched at the top of
+        # the hour, so its error compounds; the fused pass over 50 bars
+        # runs hourly and costs microseconds.
+        last_start = int(sorted_candles[-1].get("start", 0))
+        if self._last_bar.get(product_id) != last_start:
+            self._recompute_indicators(product_id, bundle)
+            self._last_bar[product_id] = last_start
+
+        ema_short = self._ema_state.get((product_id, EMA_SHORT))
+        ema_long = self._ema_state.get((product_id, EMA_LONG))
+        if ema_short is None or ema_long is None:
+            trend = Trend.SIDEWAYS
+        else:
+            spread = (ema_short - ema_long) / ema_long
+            if spread > TREND_THRESHOLD:
+                trend = Trend.UPTREND
+            elif spread < -TREND_THRESHOLD:
+                trend = Trend.DOWNTREND
+            else:
+                trend = Trend.SIDEWAYS
+
+        window = self._atr_window.get(product_id)
+        if window and len(window) >= ATR_PERIOD:
+            atr = sum(window) / Decimal(len(window))
+        else:
+            atr = None
+        return trend, atr
+
     def evaluate(
         self,
         product_id: str,
         current_price: Decimal,
-        state: dict | None,
+        state: ProductState | None,
         base_balance: Decimal,
         quote_balance: Decimal,
-        candles: list[dict],
+        candles: CandleBundle,
         daily_trade_count: int,
         now: float | None = None,
-    ) -> list:
+    ) -> tuple[list, EvalContext]:
         if now is None:
             now = time.time()
 
         actions = []
 
-        # Parse candle closes (oldest first - API returns newest first)
-        sorted_candles = sorted(candles, key=lambda c: int(c.get("start", 0)))
-        closes = [Decimal(c["close"]) for c in sorted_candles]
-
-        trend = detect_trend(closes)
-        atr = compute_atr(sorted_candles)
+        trend, atr = self._indicators(product_id, candles)
 
-        # Initialize state defaults
-        anchor_price = Decimal(state["anchor_price"]) if state and state.get("anchor_price") else None
-        last_tp_band = state["last_tp_band"] if state else 0
-        last_tp_ts = state["last_tp_timestamp"] if state and state.get("last_tp_timestamp") else 0
-        rebuy_order_id = state["rebuy_order_id"] if state else None
-        rebuy_placed_at = state["rebuy_placed_at"] if state and state.get("rebuy_placed_at") else 0
-        rebuy_price = Decimal(state["rebuy_price"]) if state and state.get("rebuy_price") else None
+        # Initialize state defaults (prices in fixed point from here on)
+        current = to_fp(current_price)
+        anchor = to_fp(state.anchor_price) if state and state.anchor_price is not None else None
+        last_tp_band = state.last_tp_band if state else 0
+        last_tp_ts = state.last_tp_timestamp if state else 0
+        rebuy_order_id = state.rebuy_order_id if state else None
+        rebuy_placed_at = state.rebuy_placed_at if state else 0
+        rebuy_price = to_fp(state.rebuy_price) if state and state.rebuy_price is not None else None
 
         # If no anchor price set, current price becomes anchor
-        if anchor_price is None:
+        if anchor is None:
             logger.info("%s | No anchor price, initializing to %s", product_id, current_price)
-            return [NoAction(product_id=product_id, reason=f"anchor_init:{current_price}")]
+            return (
+                [NoAction(product_id=product_id, reason=f"anchor_init:{current_price}")],
+                EvalContext(trend=trend, atr=atr, gain=0.0),
+            )
 
         # --- Check stale rebuy order ---
         if rebuy_order_id and rebuy_order_id.startswith("dry-run-"):
@@ -154,11 +319,10 @@ class Strategy:
                 ))
                 rebuy_order_id = None
             elif rebuy_price is not None:
-                drift = abs(current_price - rebuy_price) / rebuy_price
-                if drift > REBUY_DRIFT_THRESHOLD:
+                if abs(current - rebuy_price) * SCALE > _REBUY_DRIFT_THRESHOLD_FP * rebuy_price:
                     actions.append(CancelRebuyAction(
                         product_id=product_id, order_id=rebuy_order_id,
-                        reason=f"price_drift:{drift:.4f}"
+                        reason=f"price_drift:{abs(current - rebuy_price) / rebuy_price:.4f}"
                     ))
                     rebuy_order_id = None
 
@@ -168,70 +332,71 @@ class Strategy:
 
         # --- Take-profit evaluation ---
         if cooldown_ok and under_cap and base_balance > 0:
-            gain = (current_price - anchor_price) / anchor_price
-            for i, (threshold, fraction) in enumerate(TP_LADDER):
-                if i <= last_tp_band - 1:
-                    continue  # Already sold this band
-                if gain >= threshold:
-                    sell_fraction = fraction
-                    if trend == Trend.UPTREND:
-                        sell_fraction = sell_fraction / Decimal(2)
-
-                    sell_size = base_balance * sell_fraction
-                    sell_notional = sell_size * current_price
-
-                    # Check net profit after fees
-                    gross = sell_notional
-                    fees = gross * ESTIMATED_FEE_RATE * Decimal(2)  # buy + sell fees
-                    cost_basis = sell_size * anchor_price
-                    net = gross - cost_basis - fees
-                    if net <= 0:
-                        continue
-                    if sell_notional < MIN_NOTIONAL:
-                        continue
-
-                    actions.append(SellAction(
-                        product_id=product_id,
-                        base_size=sell_size,
-                        reason=f"tp_band_{i}:gain={gain:.4f}:trend={trend.value}",
-                        band_index=i + 1,
-                    ))
-                    break  # One sell per loop
+            base_fp = to_fp(base_balance)
+            gain_fp = _fp_div(current - anchor, anchor)
+            # Highest band whose threshold the gain has crossed; only the
+            # bands above last_tp_band are candidates
+            hit = bisect.bisect_right(_TP_THRESHOLDS_FP, gain_fp) - 1
+            for i in range(last_tp_band, hit + 1):
+                sell_fraction = _TP_FRACTIONS_FP[i]
+                if trend == Trend.UPTREND:
+                    sell_fraction = sell_fraction // 2
+
+                sell_size = _fp_mul(base_fp, sell_fraction)
+                sell_notional = _fp_mul(sell_size, current)
+
+                # Check net profit after fees (buy + sell)
+                fees = _fp_mul(sell_notional, _ROUND_TRIP_FEE_FP)
+                cost_basis = _fp_mul(sell_size, anchor)
+                net = sell_notional - cost_basis - fees
+                if net <= 0:
+                    continue
+                if sell_notional < _MIN_NOTIONAL_FP:
+                    continue
+
+                actions.append(SellAction(
+                    product_id=product_id,
+                    base_size=from_fp(sell_size),
+                    reason=f"tp_band_{i}:gain={gain_fp / SCALE:.4f}:trend={trend.value}",
+                    band_index=i + 1,
+                ))
+                break  # One sell per loop
 
         # --- Re-buy evaluation ---
-        if rebuy_order_id is None and cooldown_ok and under_cap and quote_balance >= MIN_NOTIONAL:
-            distance = REBUY_MIN_DISTANCE
-            if atr is not None and anchor_price > 0:
-                atr_pct = atr / anchor_price
-                atr_distance = atr_pct * REBUY_ATR_MULTIPLIER
+        quote_fp = to_fp(quote_balance)
+        if rebuy_order_id is None and cooldown_ok and under_cap and quote_fp >= _MIN_NOTIONAL_FP:
+            distance = _REBUY_MIN_DISTANCE_FP
+            if atr is not None and anchor > 0:
+                atr_pct = _fp_div(to_fp(atr), anchor)
+                atr_distance = _fp_mul(atr_pct, _REBUY_ATR_MULTIPLIER_FP)
                 distance = max(distance, atr_distance)
 
             if trend == Trend.DOWNTREND:
-                distance = distance * REBUY_DOWNTREND_MULTIPLIER
+                distance = _fp_mul(distance, _REBUY_DOWNTREND_MULTIPLIER_FP)
 
-            rebuy_target = anchor_price * (Decimal(1) - distance)
+            rebuy_target = _fp_mul(anchor, SCALE - distance)
             # Size: use up to 20% of quote balance
-            rebuy_quote = min(quote_balance * Decimal("0.2"), quote_balance)
-            rebuy_quote = max(rebuy_quote, MIN_NOTIONAL)
-            if rebuy_quote > quote_balance:
+            rebuy_quote = min(_fp_mul(quote_fp, _REBUY_QUOTE_FRACTION_FP), quote_fp)
+            rebuy_quote = max(rebuy_quote, _MIN_NOTIONAL_FP)
+            if rebuy_quote > quote_fp:
                 pass  # Not enough balance
             else:
-                rebuy_size = rebuy_quote / rebuy_target
+                rebuy_size = _fp_div(rebuy_quote, rebuy_target)
 
-                if rebuy_quote >= MIN_NOTIONAL:
+                if rebuy_quote >= _MIN_NOTIONAL_FP:
                     # Only place if target is below current price
-                    if rebuy_target < current_price:
+                    if rebuy_target < current:
                         actions.append(RebuyAction(
                             product_id=product_id,
-                            limit_price=rebuy_target,
-                            base_size=rebuy_size,
-                            reason=f"rebuy:dist={distance:.4f}:trend={trend.value}",
+                            limit_price=from_fp(rebuy_target),
+                            base_size=from_fp(rebuy_size),
+                            reason=f"rebuy:dist={distance / SCALE:.4f}:trend={trend.value}",
                         ))
 
         if not actions:
             actions.append(NoAction(
                 product_id=product_id,
-                reason=f"hold:gain={(current_price - anchor_price) / anchor_price if anchor_price else 0:.4f}:trend={trend.value}"
+                reason=f"hold:gain={(current - anchor) / anchor if anchor else 0:.4f}:trend={trend.value}"
             ))
 
-        return actions
+        return actions, EvalContext(trend=trend, atr=atr, gain=(current - anchor) / anchor)
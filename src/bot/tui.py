@@ -1,8 +1,11 @@
+import asyncio
 import signal
 import time
 from datetime import datetime
 from decimal import Decimal
+from operator import itemgetter
 
+import numpy as np
 from rich.columns import Columns
 from rich.console import Console
 from rich.live import Live
@@ -10,13 +13,48 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-from src.bot.strategy import compute_atr, detect_trend
-from src.coinbase.client import CoinbaseClient
+from src.bot._fast import fill_grid
+from src.bot.strategy import indicators_f64
+from src.coinbase.async_client import AsyncCoinbaseClient
 from src.config import PRODUCTS
 from src.storage.db import StateDB
 
 SPARK_CHARS = "▁▂▃▄▅▆▇█"
 
+_TREND_COLORS = {"UPTREND": "green", "DOWNTREND": "red", "SIDEWAYS": "yellow"}
+_TREND_ARROWS = {"UPTREND": " ^", "DOWNTREND": " v", "SIDEWAYS": " -"}
+
+# Static table/panel decorations built once instead of per tick
+_TRADE_COLUMNS = (
+    ("Time", {"style": "dim", "width": 12}),
+    ("Product", {"width": 10}),
+    ("Side", {"width": 5}),
+    ("Size", {"width": 14}),
+    ("Price", {"width": 14}),
+    ("Reason", {"ratio": 1}),
+)
+_EMPTY_TRADES_ROW = ("—", "—", "—", "—", "—", "No trades yet")
+
+# Decode tables for the uint8 grid codes written by fill_grid
+_CHART_CHARS = (" ", "│", "─", "┃", "█")
+_CHART_STYLES = ("white", "green", "red", "bold green", "bold red")
+
+# Chart time labels only need HH:MM, so integer math beats building a
+# full datetime per label; the UTC offset is refreshed on day rollover
+# so a long-lived dashboard tracks DST shifts
+_TZ_OFFSET = time.localtime().tm_gmtoff
+_tz_day = int(time.time() + _TZ_OFFSET) // 86400
+
+
+def _hhmm(ts: int) -> str:
+    global _TZ_OFFSET, _tz_day
+    day = int(time.time() + _TZ_OFFSET) // 86400
+    if day != _tz_day:
+        _TZ_OFFSET = time.localtime().tm_gmtoff
+        _tz_day = int(time.time() + _TZ_OFFSET) // 86400
+    local = ts + _TZ_OFFSET
+    return f"{(local // 3600) % 24:02d}:{(local // 60) % 60:02d}"
+
 
 def format_price(price: Decimal, product_id: str) -> str:
     if "BTC" in product_id:
@@ -26,9 +64,7 @@ def format_price(price: Decimal, product_id: str) -> str:
 
 def trend_text(trend) -> Text:
     name = trend.value
-    colors = {"UPTREND": "green", "DOWNTREND": "red", "SIDEWAYS": "yellow"}
-    arrows = {"UPTREND": " ^", "DOWNTREND": " v", "SIDEWAYS": " -"}
-    return Text(name + arrows.get(name, ""), style=colors.get(name, "white"))
+    return Text(name + _TREND_ARROWS.get(name, ""), style=_TREND_COLORS.get(name, "white"))
 
 
 def tp_bar(band: int, total: int = 4) -> str:
@@ -44,84 +80,57 @@ def build_candlestick_chart(candles: list[dict], height: int = 16, width: int =
 
     # Take last `width` candles
     display = candles[-width:]
-
-    # Parse OHLCV
-    parsed = []
-    for c in display:
-        parsed.append({
-            "open": Decimal(c["open"]),
-            "high": Decimal(c["high"]),
-            "low": Decimal(c["low"]),
-            "close": Decimal(c["close"]),
-            "volume": Decimal(c.get("volume", "0")),
-            "time": int(c.get("start", 0)),
-        })
+    n = len(display)
+
+    # Parse OHLCV into float64 arrays — the chart shows 2 decimals, so
+    # Decimal precision buys nothing here and float vector math is far
+    # cheaper than per-cell Decimal arithmetic
+    opens = np.fromiter((float(c["open"]) for c in display), dtype=np.float64, count=n)
+    highs = np.fromiter((float(c["high"]) for c in display), dtype=np.float64, count=n)
+    lows = np.fromiter((float(c["low"]) for c in display), dtype=np.float64, count=n)
+    closes = np.fromiter((float(c["close"]) for c in display), dtype=np.float64, count=n)
+    volumes = np.fromiter((float(c.get("volume", 0)) for c in display), dtype=np.float64, count=n)
+    times = [int(c.get("start", 0)) for c in display]
 
     # Price range across all candles
-    all_highs = [p["high"] for p in parsed]
-    all_lows = [p["low"] for p in parsed]
-    price_max = max(all_highs)
-    price_min = min(all_lows)
+    price_max = highs.max()
+    price_min = lows.min()
     price_range = price_max - price_min
     if price_range == 0:
-        price_range = Decimal("1")
+        price_range = 1.0
 
     # Volume range for bottom bar
-    volumes = [p["volume"] for p in parsed]
-    vol_max = max(volumes) if any(v > 0 for v in volumes) else Decimal("1")
+    vol_max = volumes.max() if (volumes > 0).any() else 1.0
 
     # Chart dimensions: `height` rows for price, 2 rows for volume, 1 for time axis
     chart_height = height
 
     # Build grid: each cell is (char, style)
     # Columns: axis_label (8 chars) + candle columns (2 chars each: candle + gap)
-    col_count = len(parsed)
-
-    # Initialize grid
-    grid = [[(" ", "white") for _ in range(col_count)] for _ in range(chart_height)]
-
-    # Map price to row (row 0 = top = price_max, row chart_height-1 = bottom = price_min)
-    def price_to_row(price: Decimal) -> int:
-        if price_range == 0:
-            return chart_height // 2
-        ratio = (price_max - price) / price_range
-        row = int(ratio * (chart_height - 1))
-        return max(0, min(chart_height - 1, row))
-
-    # Draw each candle
-    for col, p in enumerate(parsed):
-        bullish = p["close"] >= p["open"]
-        color = "green" if bullish else "red"
-
-        body_top = price_to_row(max(p["open"], p["close"]))
-        body_bot = price_to_row(min(p["open"], p["close"]))
-        wick_top = price_to_row(p["high"])
-        wick_bot = price_to_row(p["low"])
-
-        # Draw wick above body
-        for row in range(wick_top, body_top):
-            grid[row][col] = ("│", color)
-
-        # Draw body
-        if body_top == body_bot:
-            # Doji — single line
-            grid[body_top][col] = ("─", color)
-        else:
-            for row in range(body_top, body_bot + 1):
-                if bullish:
-                    grid[row][col] = ("┃", f"bold {color}")
-                else:
-                    grid[row][col] = ("█", color)
+    col_count = n
+
+    # Map prices to rows in one shot (row 0 = top = price_max)
+    def _to_rows(prices: np.ndarray) -> np.ndarray:
+        rows = ((price_max - prices) / price_range * (chart_height - 1)).astype(np.int32)
+        return np.clip(rows, 0, chart_height - 1)
 
-        # Draw wick below body
-        for row in range(body_bot + 1, wick_bot + 1):
-            grid[row][col] = ("│", color)
+    bullish_arr = closes >= opens
+    body_tops = _to_rows(np.maximum(opens, closes))
+    body_bots = _to_rows(np.minimum(opens, closes))
+    wick_tops = _to_rows(highs)
+    wick_bots = _to_rows(lows)
+
+    # Fill the grid as uint8 codes in the JIT'd loop; rendering below
+    # decodes them to characters and styles
+    char_grid = np.zeros((chart_height, col_count), dtype=np.uint8)
+    style_grid = np.zeros((chart_height, col_count), dtype=np.uint8)
+    fill_grid(body_tops, body_bots, wick_tops, wick_bots, bullish_arr, char_grid, style_grid)
 
     # Build price axis labels (show 5 levels)
     axis_labels = {}
     for i in range(5):
         row = int(i * (chart_height - 1) / 4)
-        price = price_max - (price_range * Decimal(i) / Decimal(4))
+        price = price_max - (price_range * i / 4)
         axis_labels[row] = f"{price:>10,.2f}"
 
     # Render chart as Text
@@ -138,33 +147,47 @@ def build_candlestick_chart(candles: list[dict], height: int = 16, width: int =
         else:
             result.append("  │           ", style="dim")
 
-        # Candle chars
-        for col in range(col_count):
-            char, style = grid[row][col]
-            result.append(char, style=style)
+        # Candle chars: append consecutive same-style cells as one run —
+        # each Text.append allocates a span, so RLE cuts per-frame span
+        # count from cells to style changes
+        crow = char_grid[row]
+        srow = style_grid[row]
+        run_chars = [_CHART_CHARS[crow[0]]]
+        run_style = srow[0]
+        for col in range(1, col_count):
+            if srow[col] == run_style:
+                run_chars.append(_CHART_CHARS[crow[col]])
+            else:
+                result.append("".join(run_chars), style=_CHART_STYLES[run_style])
+                run_chars = [_CHART_CHARS[crow[col]]]
+                run_style = srow[col]
+        result.append("".join(run_chars), style=_CHART_STYLES[run_style])
 
         result.append(" │\n", style="dim")
 
-    # Volume bar row
+    # Volume bar row (spark indices vectorized alongside the OHLC rows)
+    vol_indices = np.minimum((volumes / vol_max * 7).astype(np.int32), 7)
     result.append("  │  Vol      ", style="dim")
-    for col, p in enumerate(parsed):
-        bullish = p["close"] >= p["open"]
-        color = "green" if bullish else "red"
-        if vol_max > 0:
-            vol_ratio = float(p["volume"] / vol_max)
+    run_chars = [SPARK_CHARS[vol_indices[0]]]
+    run_style = "green" if bullish_arr[0] else "red"
+    for col in range(1, col_count):
+        color = "green" if bullish_arr[col] else "red"
+        spark = SPARK_CHARS[vol_indices[col]]
+        if color == run_style:
+            run_chars.append(spark)
         else:
-            vol_ratio = 0
-        vol_idx = min(int(vol_ratio * 7), 7)
-        result.append(SPARK_CHARS[vol_idx], style=color)
+            result.append("".join(run_chars), style=run_style)
+            run_chars = [spark]
+            run_style = color
+    result.append("".join(run_chars), style=run_style)
     result.append(" │\n", style="dim")
 
     # Time labels
     result.append("  └", style="dim")
-    if parsed:
-        first_ts = datetime.fromtimestamp(parsed[0]["time"]).strftime("%H:%M")
-        last_ts = datetime.fromtimestamp(parsed[-1]["time"]).strftime("%H:%M")
-        mid_idx = len(parsed) // 2
-        mid_ts = datetime.fromtimestamp(parsed[mid_idx]["time"]).strftime("%H:%M")
+    if times:
+        first_ts = _hhmm(times[0])
+        last_ts = _hhmm(times[-1])
+        mid_ts = _hhmm(times[len(times) // 2])
 
         # Build time axis
         time_axis = first_ts.ljust(col_count // 2 + 6)
@@ -180,13 +203,25 @@ def build_candlestick_chart(candles: list[dict], height: int = 16, width: int =
 
 
 class LiveDashboard:
-    def __init__(self, client: CoinbaseClient, db: StateDB, products: list[str] = None, interval: int = 5):
+    def __init__(self, client: AsyncCoinbaseClient, db: StateDB, products: list[str] = None, interval: int = 5):
         self.client = client
         self.db = db
         self.products = products or PRODUCTS
         self.interval = interval
         self._running = True
         self.console = Console()
+        # Rendered chart per product, keyed by the newest candle — the
+        # grid only changes when a bar updates, not every 5s tick
+        self._chart_cache: dict[str, tuple[tuple, Panel]] = {}
+        # Product info panels keyed by everything they display, plus the
+        # last trades-table key — together these drive the dirty flag
+        # that decides whether Live.update runs at all
+        self._panel_cache: dict[str, tuple[tuple, Panel]] = {}
+        self._last_trades_key: tuple = ()
+        # Only the timestamp changes in the header, so keep the fixed
+        # parts precomputed
+        self._header_prefix = "  Bull Shark  |  "
+        self._header_suffix = f"  |  Refresh: {self.interval}s"
 
         signal.signal(signal.SIGINT, self._handle_signal)
         signal.signal(signal.SIGTERM, self._handle_signal)
@@ -194,11 +229,11 @@ class LiveDashboard:
     def _handle_signal(self, signum, frame):
         self._running = False
 
-    def _fetch_product_data(self, product_id: str) -> dict:
+    async def _fetch_product_data(self, product_id: str, balances: dict[str, Decimal]) -> dict:
         data = {"product_id": product_id, "error": None}
         try:
             # Price
-            bid_ask = self.client.get_best_bid_ask([product_id])
+            bid_ask = await self.client.get_best_bid_ask([product_id])
             pricebooks = bid_ask.get("pricebooks", [])
             if pricebooks:
                 book = pricebooks[0]
@@ -211,28 +246,30 @@ class LiveDashboard:
                     data["spread"] = ask - bid
 
             # Candles
-            candles = self.client.get_candles(product_id, "ONE_HOUR", 30)
-            sorted_candles = sorted(candles, key=lambda c: int(c.get("start", 0)))
-            closes = [Decimal(c["close"]) for c in sorted_candles]
+            # get_candles returns the series pre-sorted with int starts
+            sorted_candles = await self.client.get_candles(product_id, "ONE_HOUR", 30)
+            n = len(sorted_candles)
+            # Display-only indicators run on float64 arrays; Decimal
+            # precision stays reserved for the trading path
+            closes = np.fromiter((float(c["close"]) for c in sorted_candles), dtype=np.float64, count=n)
+            highs = np.fromiter((float(c["high"]) for c in sorted_candles), dtype=np.float64, count=n)
+            lows = np.fromiter((float(c["low"]) for c in sorted_candles), dtype=np.float64, count=n)
             data["closes"] = closes
             data["candles"] = sorted_candles
-            data["trend"] = detect_trend(closes)
-            data["atr"] = compute_atr(sorted_candles)
+            data["trend"], data["atr"] = indicators_f64(highs, lows, closes)
 
             # 24h change
-            if len(closes) >= 24:
-                old = closes[-24]
-                new = closes[-1]
-                data["change_24h"] = (new - old) / old * 100
-            elif len(closes) >= 2:
+            if n >= 24:
+                data["change_24h"] = (closes[-1] - closes[-24]) / closes[-24] * 100
+            elif n >= 2:
                 data["change_24h"] = (closes[-1] - closes[0]) / closes[0] * 100
 
             # Balances
             base = product_id.split("-")[0]
             quote = product_id.split("-")[1]
-            data["base_balance"] = self.client.get_balance(base)
+            data["base_balance"] = balances.get(base, Decimal("0"))
             data["base_currency"] = base
-            data["quote_balance"] = self.client.get_balance(quote)
+            data["quote_balance"] = balances.get(quote, Decimal("0"))
             data["quote_currency"] = quote
 
             # DB state
@@ -245,25 +282,47 @@ class LiveDashboard:
 
         return data
 
-    def _build_chart_panel(self, data: dict) -> Panel:
+    def _build_chart_panel(self, data: dict) -> tuple[Panel, bool]:
         product_id = data["product_id"]
         candles = data.get("candles", [])
 
         if data.get("error") or not candles:
-            return Panel(Text("  No chart data", style="dim"), title=f"{product_id} Chart", border_style="dim")
+            panel = Panel(Text("  No chart data", style="dim"), title=f"{product_id} Chart", border_style="dim")
+            return panel, True
+
+        key = (candles[-1].get("start"), candles[-1].get("close"))
+        cached = self._chart_cache.get(product_id)
+        if cached is not None and cached[0] == key:
+            return cached[1], False
 
         chart = build_candlestick_chart(candles, height=14, width=24)
         border_color = "green" if data.get("change_24h", 0) >= 0 else "red"
-        return Panel(chart, title=f"[bold]{product_id} 1H Candles[/bold]", border_style=border_color, padding=(0, 1))
+        panel = Panel(chart, title=f"[bold]{product_id} 1H Candles[/bold]", border_style=border_color, padding=(0, 1))
+        self._chart_cache[product_id] = (key, panel)
+        return panel, True
 
-    def _build_product_panel(self, data: dict) -> Panel:
+    def _build_product_panel(self, data: dict) -> tuple[Panel, bool]:
         product_id = data["product_id"]
 
+        state = data.get("state")
+        key = (
+            data.get("error"), data.get("mid"), data.get("bid"), data.get("ask"),
+            data.get("change_24h"), data.get("trend"), data.get("atr"),
+            data.get("base_balance"), data.get("quote_balance"),
+            tuple(sorted(state.items())) if state else None,
+            data.get("daily_trades"),
+        )
+        cached = self._panel_cache.get(product_id)
+        if cached is not None and cached[0] == key:
+            return cached[1], False
+
         if data.get("error"):
-            return Panel(
+            panel = Panel(
                 Text(f"Error: {data['error']}", style="red"),
                 title=product_id, border_style="red",
             )
+            self._panel_cache[product_id] = (key, panel)
+            return panel, True
 
         lines = []
 
@@ -308,7 +367,6 @@ class LiveDashboard:
         lines.append(Text(f"  {quote_cur}: ${quote_bal:.2f}", style="white"))
 
         # Bot state
-        state = data.get("state")
         if state:
             lines.append(Text(""))
             anchor = state.get("anchor_price")
@@ -339,16 +397,14 @@ class LiveDashboard:
 
         content = Text("\n").join(lines)
         border_color = "green" if data.get("change_24h", 0) >= 0 else "red"
-        return Panel(content, title=f"[bold]{product_id}[/bold]", border_style=border_color, padding=(1, 0))
+        panel = Panel(content, title=f"[bold]{product_id}[/bold]", border_style=border_color, padding=(1, 0))
+        self._panel_cache[product_id] = (key, panel)
+        return panel, True
 
     def _build_trades_table(self, all_data: list[dict]) -> Panel:
         table = Table(show_header=True, header_style="bold", expand=True, padding=(0, 1))
-        table.add_column("Time", style="dim", width=12)
-        table.add_column("Product", width=10)
-        table.add_column("Side", width=5)
-        table.add_column("Size", width=14)
-        table.add_column("Price", width=14)
-        table.add_column("Reason", ratio=1)
+        for name, kwargs in _TRADE_COLUMNS:
+            table.add_column(name, **kwargs)
 
         trades = []
         for data in all_data:
@@ -356,7 +412,7 @@ class LiveDashboard:
                 t["_product"] = data["product_id"]
                 trades.append(t)
 
-        trades.sort(key=lambda t: t["created_at"], reverse=True)
+        trades.sort(key=itemgetter("created_at"), reverse=True)
 
         for t in trades[:10]:
             ts = datetime.fromtimestamp(t["created_at"]).strftime("%m-%d %H:%M")
@@ -367,24 +423,44 @@ class LiveDashboard:
             )
 
         if not trades:
-            table.add_row("—", "—", "—", "—", "—", "No trades yet")
+            table.add_row(*_EMPTY_TRADES_ROW)
 
         return Panel(table, title="[bold]Recent Trades[/bold]", border_style="blue")
 
-    def _build_layout(self) -> Table:
-        all_data = []
-        for product_id in self.products:
-            all_data.append(self._fetch_product_data(product_id))
+    async def _build_layout(self) -> tuple[Table, bool]:
+        # One accounts call covers every product's balances; the rest of
+        # the per-product fetches are independent HTTPS calls, gathered so
+        # a refresh costs one round-trip instead of products x RTT
+        try:
+            balances = await self.client.get_balances_map()
+        except Exception:
+            balances = {}
+        all_data = list(
+            await asyncio.gather(*[self._fetch_product_data(pid, balances) for pid in self.products])
+        )
 
         # Header
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        header = Text(f"  Bull Shark  |  {now}  |  Refresh: {self.interval}s", style="bold cyan")
-
-        # Charts side by side
-        charts = [self._build_chart_panel(d) for d in all_data]
+        header = Text(f"{self._header_prefix}{now}{self._header_suffix}", style="bold cyan")
 
-        # Info panels side by side
-        panels = [self._build_product_panel(d) for d in all_data]
+        # Charts and info panels side by side; each reports whether it
+        # actually changed so the caller can skip redundant redraws
+        charts, panels = [], []
+        dirty = False
+        for data in all_data:
+            chart, chart_changed = self._build_chart_panel(data)
+            panel, panel_changed = self._build_product_panel(data)
+            charts.append(chart)
+            panels.append(panel)
+            dirty = dirty or chart_changed or panel_changed
+
+        trades_key = tuple(
+            (d["product_id"], t["created_at"])
+            for d in all_data for t in d.get("recent_trades", [])
+        )
+        if trades_key != self._last_trades_key:
+            self._last_trades_key = trades_key
+            dirty = True
 
         # Full layout as a vertical stack
         layout = Table.grid(expand=True)
@@ -393,17 +469,31 @@ class LiveDashboard:
         layout.add_row(Columns(panels, equal=True, expand=True))
         layout.add_row(self._build_trades_table(all_data))
 
-        return layout
+        return layout, dirty
+
+    async def _run_async(self):
+        try:
+            layout, _ = await self._build_layout()
+            with Live(layout, console=self.console, refresh_per_second=1, screen=True) as live:
+                last_refresh = time.monotonic()
+                while self._running:
+                    try:
+                        layout, dirty = await self._build_layout()
+                        now = time.monotonic()
+                        # Redraw only when data moved; the 30s floor keeps
+                        # the header clock from going completely stale
+                        if dirty or now - last_refresh > 30:
+                            live.update(layout)
+                            last_refresh = now
+                    except Exception:
+                        pass  # Don't crash on transient API errors
+
+                    for _ in range(self.interval):
+                        if not self._running:
+                            break
+                        await asyncio.sleep(1)
+        finally:
+            await self.client.close()
 
     def run(self):
-        with Live(self._build_layout(), console=self.console, refresh_per_second=1, screen=True) as live:
-            while self._running:
-                try:
-                    live.update(self._build_layout())
-                except Exception:
-                    pass  # Don't crash on transient API errors
-
-                for _ in range(self.interval):
-                    if not self._running:
-                        break
-                    time.sleep(1)
+        asyncio.run(self._run_async())
@@ -2,14 +2,23 @@ import logging
 import time
 import uuid
 from decimal import Decimal
+from operator import itemgetter
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.coinbase.auth import build_jwt
 from src.config import API_BASE
 
 logger = logging.getLogger(__name__)
 
+_GRANULARITY_SECONDS = {
+    "ONE_MINUTE": 60, "FIVE_MINUTE": 300, "FIFTEEN_MINUTE": 900,
+    "THIRTY_MINUTE": 1800, "ONE_HOUR": 3600, "TWO_HOUR": 7200,
+    "SIX_HOUR": 21600, "ONE_DAY": 86400,
+}
+
 
 class CoinbaseAPIError(Exception):
     def __init__(self, status_code: int, message: str):
@@ -25,6 +34,9 @@ class CoinbaseClient:
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
         self.session = requests.Session()
+        # Default pool is 10/10; widen it so concurrent callers reuse
+        # warm TLS connections instead of handshaking per request
+        self.session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
 
     def _request(self, method: str, path: str, params: dict = None, json_body: dict = None):
         url = f"{API_BASE}{path}"
@@ -35,8 +47,11 @@ class CoinbaseClient:
                 "Content-Type": "application/json",
             }
             try:
+                # Encode bodies with orjson directly; requests would
+                # otherwise run stdlib json plus a str->bytes round trip
+                body = orjson.dumps(json_body) if json_body is not None else None
                 resp = self.session.request(
-                    method, url, headers=headers, params=params, json=json_body, timeout=10
+                    method, url, headers=headers, params=params, data=body, timeout=10
                 )
             except requests.RequestException as e:
                 logger.warning("Request failed (attempt %d): %s", attempt + 1, e)
@@ -54,7 +69,8 @@ class CoinbaseClient:
             if resp.status_code >= 400:
                 raise CoinbaseAPIError(resp.status_code, resp.text)
 
-            return resp.json()
+            # orjson is 2-3x faster than stdlib json on these payloads
+            return orjson.loads(resp.content)
 
         raise CoinbaseAPIError(0, "Max retries exceeded")
 
@@ -69,16 +85,17 @@ class CoinbaseClient:
 
     def get_candles(self, product_id: str, granularity: str = "ONE_HOUR", limit: int = 50) -> list:
         end = int(time.time())
-        granularity_seconds = {
-            "ONE_MINUTE": 60, "FIVE_MINUTE": 300, "FIFTEEN_MINUTE": 900,
-            "THIRTY_MINUTE": 1800, "ONE_HOUR": 3600, "TWO_HOUR": 7200,
-            "SIX_HOUR": 21600, "ONE_DAY": 86400,
-        }
-        seconds = granularity_seconds.get(granularity, 3600)
+        seconds = _GRANULARITY_SECONDS.get(granularity, 3600)
         start = end - (seconds * limit)
         params = {"start": str(start), "end": str(end), "granularity": granularity}
         resp = self._request("GET", f"/api/v3/brokerage/products/{product_id}/candles", params=params)
-        return resp.get("candles", [])
+        candles = resp.get("candles", [])
+        # Normalize start to int and sort oldest-first once here, so
+        # consumers read the series directly instead of re-sorting
+        for c in candles:
+            c["start"] = int(c.get("start", 0))
+        candles.sort(key=itemgetter("start"))
+        return candles
 
     def get_accounts(self) -> list:
         resp = self._request("GET", "/api/v3/brokerage/accounts", params={"limit": "250"})
@@ -91,6 +108,14 @@ class CoinbaseClient:
                 return Decimal(acct["available_balance"]["value"])
         return Decimal("0")
 
+    def get_balances_map(self) -> dict[str, Decimal]:
+        """Available balance per currency from a single accounts fetch."""
+        return {
+            acct["currency"]: Decimal(acct["available_balance"]["value"])
+            for acct in self.get_accounts()
+            if acct.get("currency")
+        }
+
     def get_order(self, order_id: str) -> dict:
         return self._request("GET", f"/api/v3/brokerage/orders/historical/{order_id}")
 
@@ -0,0 +1,91 @@
+import asyncio
+import json
+import logging
+import random
+import time
+from decimal import Decimal
+
+import websockets
+
+logger = logging.getLogger(__name__)
+
+WS_URL = "wss://advanced-trade-ws.coinbase.com"
+
+# How old a cached quote may be before callers should fall back to REST
+STALE_SECONDS = 5.0
+
+
+class TickerFeed:
+    """Best bid/ask cache fed by the Advanced Trade ticker WebSocket channel.
+
+    One subscription covers all products; quotes arrive on push so readers
+    get sub-second freshness with zero I/O. The feed reconnects on its own
+    with jittered exponential backoff.
+    """
+
+    def __init__(self, product_ids: list[str], events: asyncio.Queue | None = None):
+        self.product_ids = product_ids
+        self.book_cache: dict[str, tuple[Decimal, Decimal, float]] = {}
+        self._events = events
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get(self, product_id: str, max_age: float = STALE_SECONDS) -> tuple[Decimal, Decimal, float] | None:
+        """Return (best_bid, best_ask, ts) if cached and fresh, else None."""
+        entry = self.book_cache.get(product_id)
+        if entry is None:
+            return None
+        if time.time() - entry[2] > max_age:
+            return None
+        return entry
+
+    async def _run(self):
+        backoff = 1.0
+        while True:
+            try:
+                async with websockets.connect(WS_URL) as ws:
+                    await ws.send(json.dumps({
+                        "type": "subscribe",
+                        "product_ids": self.product_ids,
+                        "channel": "ticker",
+                    }))
+                    logger.info("Ticker feed connected for %s", self.product_ids)
+                    backoff = 1.0
+                    async for raw in ws:
+                        self._handle(json.loads(raw))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Ticker feed dropped: %s", e)
+
+            wait = backoff + random.uniform(0, backoff)
+            backoff = min(backoff * 2, 60.0)
+            logger.info("Reconnecting ticker feed in %.1fs", wait)
+            await asyncio.sleep(wait)
+
+    def _handle(self, msg: dict):
+        if msg.get("channel") != "ticker":
+            return
+        now = time.time()
+        for event in msg.get("events", []):
+            for ticker in event.get("tickers", []):
+                product_id = ticker.get("product_id")
+                bid = ticker.get("best_bid")
+                ask = ticker.get("best_ask")
+                if product_id and bid and ask:
+                    bid_d, ask_d = Decimal(bid), Decimal(ask)
+                    self.book_cache[product_id] = (bid_d, ask_d, now)
+                    if self._events is not None:
+                        self._events.put_nowait((product_id, bid_d, ask_d))
@@ -1,6 +1,8 @@
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from src.config import LOG_DIR, LOG_LEVEL
 
@@ -8,7 +10,7 @@ LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
-def setup_logging():
+def setup_logging() -> QueueListener:
     formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
 
     console = logging.StreamHandler(sys.stdout)
@@ -21,11 +23,23 @@ def setup_logging():
     )
     file_handler.setFormatter(formatter)
 
+    # Hot paths only pay for an enqueue; formatting, disk writes and
+    # rotation happen on the listener's background thread
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, console, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     root = logging.getLogger()
     root.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
-    root.addHandler(console)
-    root.addHandler(file_handler)
+    root.addHandler(QueueHandler(log_queue))
 
-    # Quiet noisy libraries
+    # Quiet noisy libraries: httpx logs every request at INFO, which
+    # would put several lines on the hot path per tick fan-out; the
+    # requests/urllib3 pair still backs the sync CLI client
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("requests").setLevel(logging.WARNING)
+
+    return listener
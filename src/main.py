@@ -1,48 +1,75 @@
-import argparse
-import logging
 import sys
 
-from src.logging_setup import setup_logging
+_core = None
+
+
+def _load_core():
+    """Import and cache the classes every bot subcommand needs.
+
+    One importlib traversal for the whole process; repeat dispatches
+    (e.g. dry-run delegating to run) hit the cached namespace.
+    """
+    global _core
+    if _core is None:
+        from types import SimpleNamespace
+
+        from src.bot.runner import BotRunner
+        from src.bot.strategy import Strategy
+        from src.coinbase.async_client import AsyncCoinbaseClient
+        from src.storage.db import StateDB
+
+        _core = SimpleNamespace(
+            BotRunner=BotRunner,
+            Strategy=Strategy,
+            AsyncCoinbaseClient=AsyncCoinbaseClient,
+            StateDB=StateDB,
+        )
+    return _core
 
 
 def cmd_run(args):
-    from src.bot.runner import BotRunner
-    from src.bot.strategy import Strategy
-    from src.coinbase.client import CoinbaseClient
+    import asyncio
+
     from src.config import DRY_RUN
-    from src.storage.db import StateDB
 
+    core = _load_core()
     dry_run = args.dry_run if hasattr(args, "dry_run") else DRY_RUN
     products = args.products.split(",") if args.products else None
 
-    client = CoinbaseClient(dry_run=dry_run)
-    db = StateDB()
-    strategy = Strategy()
-    runner = BotRunner(client, db, strategy, products=products, dry_run=dry_run)
+    # libuv event loop is 2-4x faster than the stdlib selector loop;
+    # fall back silently where uvloop is unavailable (e.g. Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    client = core.AsyncCoinbaseClient(dry_run=dry_run)
+    db = core.StateDB()
+    strategy = core.Strategy()
+    runner = core.BotRunner(client, db, strategy, products=products, dry_run=dry_run)
 
     try:
-        runner.run_loop(once=args.once)
+        asyncio.run(runner.run_loop(once=args.once))
     finally:
         db.close()
 
 
 def cmd_status(args):
-    from src.bot.runner import BotRunner
-    from src.bot.strategy import Strategy
-    from src.coinbase.client import CoinbaseClient
-    from src.storage.db import StateDB
-
+    core = _load_core()
     products = args.products.split(",") if args.products else None
 
-    client = CoinbaseClient(dry_run=True)
-    db = StateDB()
-    strategy = Strategy()
-    runner = BotRunner(client, db, strategy, products=products, dry_run=True)
+    client = core.AsyncCoinbaseClient(dry_run=True)
+    db = core.StateDB(readonly=True)
+    strategy = core.Strategy()
+    runner = core.BotRunner(client, db, strategy, products=products, dry_run=True)
     runner.print_status()
     db.close()
 
 
 def cmd_test_auth(args):
+    import logging
+
     from src.coinbase.client import CoinbaseClient
 
     logger = logging.getLogger(__name__)
@@ -62,13 +89,12 @@ def cmd_test_auth(args):
 
 def cmd_watch(args):
     from src.bot.tui import LiveDashboard
-    from src.coinbase.client import CoinbaseClient
-    from src.storage.db import StateDB
 
+    core = _load_core()
     products = args.products.split(",") if args.products else None
 
-    client = CoinbaseClient(dry_run=True)
-    db = StateDB()
+    client = core.AsyncCoinbaseClient(dry_run=True)
+    db = core.StateDB(readonly=True)
     dashboard = LiveDashboard(client, db, products=products, interval=args.interval)
 
     try:
@@ -82,47 +108,137 @@ def cmd_dry_run(args):
     cmd_run(args)
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Bull Shark — Spot Trading Bot")
-    parser.add_argument("--log-level", default=None, help="Override log level")
-
-    sub = parser.add_subparsers(dest="command")
-
-    run_parser = sub.add_parser("run", help="Run the trading bot")
+def _add_run_parser(sub):
+    run_parser = sub.add_parser("run", help=_COMMAND_HELP["run"])
     run_parser.add_argument("--once", action="store_true", help="Run one loop iteration then exit")
     run_parser.add_argument("--products", default=None, help="Comma-separated product IDs")
     run_parser.add_argument("--dry-run", action="store_true", help="Enable dry-run mode")
     run_parser.set_defaults(func=cmd_run)
 
-    dry_parser = sub.add_parser("dry-run", help="Run in dry-run mode (no real orders)")
+
+def _add_dry_run_parser(sub):
+    dry_parser = sub.add_parser("dry-run", help=_COMMAND_HELP["dry-run"])
     dry_parser.add_argument("--once", action="store_true", help="Run one loop iteration then exit")
     dry_parser.add_argument("--products", default=None, help="Comma-separated product IDs")
     dry_parser.set_defaults(func=cmd_dry_run)
 
-    status_parser = sub.add_parser("status", help="Show bot status dashboard")
+
+def _add_status_parser(sub):
+    status_parser = sub.add_parser("status", help=_COMMAND_HELP["status"])
     status_parser.add_argument("--products", default=None, help="Comma-separated product IDs")
     status_parser.set_defaults(func=cmd_status)
 
-    watch_parser = sub.add_parser("watch", help="Live TUI dashboard")
+
+def _add_watch_parser(sub):
+    watch_parser = sub.add_parser("watch", help=_COMMAND_HELP["watch"])
     watch_parser.add_argument("--products", default=None, help="Comma-separated product IDs")
     watch_parser.add_argument("--interval", type=int, default=5, help="Refresh interval in seconds (default: 5)")
     watch_parser.set_defaults(func=cmd_watch)
 
-    auth_parser = sub.add_parser("test-auth", help="Test API authentication")
+
+def _add_test_auth_parser(sub):
+    auth_parser = sub.add_parser("test-auth", help=_COMMAND_HELP["test-auth"])
     auth_parser.set_defaults(func=cmd_test_auth)
 
+
+_SUBCOMMANDS = {
+    "run": _add_run_parser,
+    "dry-run": _add_dry_run_parser,
+    "status": _add_status_parser,
+    "watch": _add_watch_parser,
+    "test-auth": _add_test_auth_parser,
+}
+
+_COMMAND_HELP = {
+    "run": "Run the trading bot",
+    "dry-run": "Run in dry-run mode (no real orders)",
+    "status": "Show bot status dashboard",
+    "watch": "Live TUI dashboard",
+    "test-auth": "Test API authentication",
+}
+
+
+def _print_overview():
+    """Hand-rolled top-level help so --help never builds a parser tree."""
+    import os
+
+    prog = os.path.basename(sys.argv[0]) or "main.py"
+    commands = ",".join(_COMMAND_HELP)
+    print(f"usage: {prog} [-h] [--log-level LOG_LEVEL] {{{commands}}} ...")
+    print()
+    print("Bull Shark — Spot Trading Bot")
+    print()
+    print("commands:")
+    for name, help_text in _COMMAND_HELP.items():
+        print(f"  {name:<12}{help_text}")
+    print()
+    print("options:")
+    print("  -h, --help            show this help message and exit")
+    print("  --log-level LOG_LEVEL Override log level")
+
+
+def _sniff_subcommand(argv):
+    """First non-flag token in argv, skipping --log-level's value."""
+    expect_value = False
+    for tok in argv:
+        if expect_value:
+            expect_value = False
+            continue
+        if tok == "--log-level":
+            expect_value = True
+            continue
+        if tok.startswith("-"):
+            continue
+        return tok
+    return None
+
+
+def main():
+    # Fast paths that need no option parsing skip argparse entirely:
+    # top-level help, the bare invocation, and plain test-auth
+    argv = sys.argv[1:]
+    if not argv or argv[0] in ("-h", "--help"):
+        _print_overview()
+        sys.exit(0 if argv else 1)
+    if argv == ["test-auth"]:
+        from src.logging_setup import setup_logging
+
+        setup_logging()
+        cmd_test_auth(None)
+        return
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bull Shark — Spot Trading Bot")
+    parser.add_argument("--log-level", default=None, help="Override log level")
+
+    sub = parser.add_subparsers(dest="command")
+
+    # Register only the subparser this invocation names; --help, bad
+    # commands and the bare invocation still get the full listing
+    command = _sniff_subcommand(sys.argv[1:])
+    if command in _SUBCOMMANDS:
+        _SUBCOMMANDS[command](sub)
+    else:
+        for add_parser in _SUBCOMMANDS.values():
+            add_parser(sub)
+
     args = parser.parse_args()
 
     if args.log_level:
         import src.config as cfg
         cfg.LOG_LEVEL = args.log_level.upper()
 
-    setup_logging()
-
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
+    # Imported only once a real subcommand runs, so --help and argparse
+    # errors skip the logging stack entirely
+    from src.logging_setup import setup_logging
+
+    setup_logging()
+
     args.func(args)
 
 
@@ -1,35 +1,240 @@
+from __future__ import annotations
+
 import sqlite3
 import time
-from datetime import date
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from decimal import Decimal
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 from src.config import DB_PATH
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+# Local-midnight rollover detection via epoch-day arithmetic; the hot
+# path never touches localtime() — the offset is re-resolved only when
+# the day rolls over, so a DST shift corrects itself at the next
+# midnight instead of skewing the cache key against date.today() forever
+_TZ_OFFSET = time.localtime().tm_gmtoff
+_today_cache: tuple[int, str] = (-1, "")
+
+
+def _today() -> str:
+    """Today's ISO date string, recomputed only on day rollover."""
+    global _today_cache, _TZ_OFFSET
+    day = int(time.time() + _TZ_OFFSET) // 86400
+    if day != _today_cache[0]:
+        from datetime import date
+
+        _TZ_OFFSET = time.localtime().tm_gmtoff
+        day = int(time.time() + _TZ_OFFSET) // 86400
+        _today_cache = (day, date.today().isoformat())
+    return _today_cache[1]
+
+
+# Prices and sizes are stored as fixed 8-decimal integers (satoshi
+# style), so rows carry small ints instead of strings and reads skip
+# string parsing; Decimal stays the type on both sides of the boundary
+_PRICE_SCALE = 10 ** 8
+_PRICE_FIELDS = frozenset({"anchor_price", "avg_entry_price", "rebuy_price", "rebuy_size"})
+
+
+@lru_cache(maxsize=1024)
+def _enc(value) -> int | None:
+    """Decimal (or numeric string) -> scaled int for storage.
+
+    Memoized: a bot revisits the same handful of price levels (anchors,
+    resting rebuys) far more often than it sees new ones.
+    """
+    if value is None:
+        return None
+    return int(Decimal(value) * _PRICE_SCALE)
+
+
+def _dec(value) -> Decimal | None:
+    """Scaled int from storage -> Decimal."""
+    if value is None:
+        return None
+    return Decimal(value).scaleb(-8)
+
+
+# Static statements built once at import; together with the enlarged
+# sqlite3 statement cache these are parsed by SQLite a single time
+_SQL_GET_STATE = "SELECT * FROM product_state WHERE product_id = ?"
+_SQL_GET_STATE_TYPED = """SELECT anchor_price, last_tp_band, last_tp_timestamp,
+                                 rebuy_order_id, rebuy_placed_at, rebuy_price
+                          FROM product_state WHERE product_id = ?"""
+_SQL_GET_REBUY = """SELECT rebuy_order_id, rebuy_price, rebuy_size, anchor_price
+                    FROM product_state WHERE product_id = ?"""
+_SQL_GET_DAILY = "SELECT daily_trade_date, daily_trade_count FROM product_state WHERE product_id = ?"
+_SQL_INSERT_TRADE = """INSERT INTO trades
+    (product_id, side, order_type, order_id, price, size, quote_total, fee, reason, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_SQL_RECENT_TRADES = "SELECT * FROM trades WHERE product_id = ? ORDER BY created_at DESC LIMIT ?"
+
+# Bump when the DDL below changes; gates _create_tables so repeat opens
+# skip the executescript (and its momentary write lock) entirely
+_SCHEMA_VERSION = 1
+
+
+@lru_cache(maxsize=64)
+def _upsert_sql(field_names: tuple[str, ...]) -> str:
+    """Native UPSERT statement for a given field set, generated once per
+    distinct combination the callers actually use."""
+    cols = ", ".join(("product_id",) + field_names)
+    placeholders = ", ".join("?" for _ in range(len(field_names) + 1))
+    sets = ", ".join(f"{name} = excluded.{name}" for name in field_names)
+    return (
+        f"INSERT INTO product_state ({cols}) VALUES ({placeholders}) "
+        f"ON CONFLICT(product_id) DO UPDATE SET {sets}"
+    )
+
+
+@dataclass(slots=True)
+class ProductState:
+    """Typed snapshot of the hot-path product_state columns.
+
+    Built once per read with Decimals already parsed, so the strategy and
+    runner do attribute access instead of repeated dict lookups and
+    re-parsing the same price strings.
+    """
+    anchor_price: Decimal | None
+    last_tp_band: int
+    last_tp_timestamp: float
+    rebuy_order_id: str | None
+    rebuy_placed_at: float
+    rebuy_price: Decimal | None
+
 
 class StateDB:
-    def __init__(self, db_path: Path = DB_PATH):
-        self.conn = sqlite3.connect(str(db_path))
-        self.conn.row_factory = sqlite3.Row
+    def __init__(self, db_path: Path = DB_PATH, readonly: bool = False):
+        self._db_path_str = str(db_path)
+        self._in_txn = False
+        self._readonly = False
+        # SELECT * column names, resolved from cursor.description on
+        # first fetch; rows stay plain tuples (no sqlite3.Row factory)
+        self._state_cols: tuple[str, ...] | None = None
+        self._trade_cols: tuple[str, ...] | None = None
+
+        if readonly:
+            # Pure-reader open: no DDL, no write lock ever taken. Falls
+            # through to the normal path when the file doesn't exist yet
+            # or carries a pre-versioning schema that still needs the
+            # migration in _create_tables
+            try:
+                conn = sqlite3.connect(
+                    f"file:{self._db_path_str}?mode=ro", uri=True,
+                    cached_statements=256, check_same_thread=False,
+                )
+                if conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION:
+                    conn.execute("PRAGMA mmap_size=134217728")
+                    self.conn = conn
+                    self._read_conn = conn
+                    self._readonly = True
+                    return
+                conn.close()
+            except sqlite3.OperationalError:
+                pass
+
+        self.conn = sqlite3.connect(self._db_path_str, cached_statements=256)
         self.conn.execute("PRAGMA journal_mode=WAL")
+        # With WAL, NORMAL only fsyncs at checkpoint instead of per commit
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Keep temp structures and a generous page cache in memory, and
+        # mmap the database file so reads skip the syscall path
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")  # ~20 MB
+        self.conn.execute("PRAGMA mmap_size=134217728")  # 128 MB
+        # Checkpointing is driven explicitly (see checkpoint()); the
+        # default 1000-page auto-checkpoint makes a random COMMIT absorb
+        # the whole WAL flush and spike its latency
+        self.conn.execute("PRAGMA wal_autocheckpoint=0")
         self._create_tables()
+        # Separate read-only connection for the get_* paths: with WAL a
+        # reader never blocks on (or is blocked by) the writer, and
+        # check_same_thread=False lets dashboard threads share it. Falls
+        # back to the write connection where ro mode isn't possible.
+        self._read_conn = self.conn
+        if self._db_path_str != ":memory:":
+            try:
+                read_conn = sqlite3.connect(
+                    f"file:{self._db_path_str}?mode=ro", uri=True,
+                    cached_statements=256, check_same_thread=False,
+                )
+                read_conn.execute("PRAGMA mmap_size=134217728")
+                self._read_conn = read_conn
+            except sqlite3.OperationalError:
+                pass
+
+    @contextmanager
+    def transaction(self):
+        """Group several mutations into a single commit (one WAL fsync).
+
+        Nest-safe: the public mutators run inside this themselves, so a
+        caller-level transaction absorbs theirs instead of committing
+        mid-batch.
+        """
+        if self._in_txn:
+            yield
+            return
+        self._in_txn = True
+        try:
+            with self.conn:
+                yield
+        finally:
+            self._in_txn = False
+
+    def _migrate_legacy_prices(self):
+        """Rescale a pre-versioning database to the integer price layout.
+
+        Before user_version was stamped, prices were stored as TEXT;
+        reading those rows through _dec would shift them by 1e8 (a
+        '50000.25' anchor would come back as 0.0005000025). Rewrite any
+        TEXT price cells as scaled integers in place; typeof() makes the
+        pass idempotent and a no-op on already-migrated rows.
+        """
+        tables = {
+            "product_state": ("anchor_price", "avg_entry_price", "rebuy_price", "rebuy_size"),
+            "trades": ("price", "size", "quote_total", "fee"),
+        }
+        with self.conn:
+            for table, columns in tables.items():
+                exists = self.conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+                ).fetchone()
+                if exists is None:
+                    continue
+                for col in columns:
+                    self.conn.execute(
+                        f"UPDATE {table} SET {col} = "
+                        f"CAST(CAST({col} AS REAL) * {_PRICE_SCALE} + 0.5 AS INTEGER) "
+                        f"WHERE {col} IS NOT NULL AND typeof({col}) = 'text'"
+                    )
 
     def _create_tables(self):
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION:
+            return
+        # version 0 covers both a fresh file and a legacy pre-versioning
+        # database; the migration distinguishes them by table existence
+        self._migrate_legacy_prices()
         self.conn.executescript("""
             CREATE TABLE IF NOT EXISTS product_state (
                 product_id      TEXT PRIMARY KEY,
-                anchor_price    TEXT,
-                avg_entry_price TEXT,
+                anchor_price    INTEGER,
+                avg_entry_price INTEGER,
                 last_tp_band    INTEGER DEFAULT 0,
                 last_tp_timestamp REAL DEFAULT 0,
                 daily_trade_count INTEGER DEFAULT 0,
                 daily_trade_date  TEXT,
                 rebuy_order_id    TEXT,
-                rebuy_price       TEXT,
-                rebuy_size        TEXT,
+                rebuy_price       INTEGER,
+                rebuy_size        INTEGER,
                 rebuy_placed_at   REAL DEFAULT 0,
                 updated_at        REAL
-            );
+            ) WITHOUT ROWID;
 
             CREATE TABLE IF NOT EXISTS trades (
                 id          INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -37,100 +242,208 @@ class StateDB:
                 side        TEXT NOT NULL,
                 order_type  TEXT NOT NULL,
                 order_id    TEXT,
-                price       TEXT,
-                size        TEXT,
-                quote_total TEXT,
-                fee         TEXT,
+                price       INTEGER,
+                size        INTEGER,
+                quote_total INTEGER,
+                fee         INTEGER,
                 reason      TEXT,
                 created_at  REAL NOT NULL
             );
+
+            CREATE INDEX IF NOT EXISTS idx_trades_product_created
+                ON trades (product_id, created_at DESC);
         """)
+        self.conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
         self.conn.commit()
 
     def get_product_state(self, product_id: str) -> dict | None:
-        row = self.conn.execute(
-            "SELECT * FROM product_state WHERE product_id = ?", (product_id,)
-        ).fetchone()
+        cur = self._read_conn.execute(_SQL_GET_STATE, (product_id,))
+        row = cur.fetchone()
         if row is None:
             return None
-        return dict(row)
-
-    def upsert_product_state(self, product_id: str, **fields):
-        fields["updated_at"] = time.time()
-        existing = self.get_product_state(product_id)
-        if existing is None:
-            fields["product_id"] = product_id
-            cols = ", ".join(fields.keys())
-            placeholders = ", ".join("?" for _ in fields)
-            self.conn.execute(
-                f"INSERT INTO product_state ({cols}) VALUES ({placeholders})",
-                list(fields.values()),
-            )
-        else:
-            sets = ", ".join(f"{k} = ?" for k in fields)
-            self.conn.execute(
-                f"UPDATE product_state SET {sets} WHERE product_id = ?",
-                list(fields.values()) + [product_id],
-            )
-        self.conn.commit()
+        if self._state_cols is None:
+            self._state_cols = tuple(d[0] for d in cur.description)
+        state = dict(zip(self._state_cols, row))
+        for name in _PRICE_FIELDS:
+            state[name] = _dec(state[name])
+        return state
 
-    def set_rebuy_order(self, product_id: str, order_id: str, price: Decimal, size: Decimal):
+    def get_product_state_typed(self, product_id: str) -> ProductState | None:
+        row = self._read_conn.execute(_SQL_GET_STATE_TYPED, (product_id,)).fetchone()
+        if row is None:
+            return None
+        return ProductState(
+            anchor_price=_dec(row[0]),
+            last_tp_band=row[1] or 0,
+            last_tp_timestamp=row[2] or 0,
+            rebuy_order_id=row[3],
+            rebuy_placed_at=row[4] or 0,
+            rebuy_price=_dec(row[5]),
+        )
+
+    def _upsert(self, product_id: str, now: float | None = None, **fields):
+        """Insert-or-update product_state in one statement without committing."""
+        for name in _PRICE_FIELDS.intersection(fields):
+            fields[name] = _enc(fields[name])
+        fields["updated_at"] = time.time() if now is None else now
+        self.conn.execute(_upsert_sql(tuple(fields)), (product_id, *fields.values()))
+
+    def upsert_product_state(self, product_id: str, now: float | None = None, **fields):
+        with self.transaction():
+            self._upsert(product_id, now=now, **fields)
+
+    def set_rebuy_order(
+        self, product_id: str, order_id: str, price: Decimal, size: Decimal,
+        now: float | None = None,
+    ):
+        now = time.time() if now is None else now
         self.upsert_product_state(
             product_id,
+            now=now,
             rebuy_order_id=order_id,
-            rebuy_price=str(price),
-            rebuy_size=str(size),
-            rebuy_placed_at=time.time(),
+            rebuy_price=price,
+            rebuy_size=size,
+            rebuy_placed_at=now,
         )
 
-    def clear_rebuy_order(self, product_id: str):
+    def clear_rebuy_order(self, product_id: str, now: float | None = None):
         self.upsert_product_state(
             product_id,
+            now=now,
             rebuy_order_id=None,
             rebuy_price=None,
             rebuy_size=None,
             rebuy_placed_at=0,
         )
 
-    def increment_daily_trades(self, product_id: str):
-        state = self.get_product_state(product_id)
-        today = date.today().isoformat()
-        if state and state["daily_trade_date"] == today:
-            count = state["daily_trade_count"] + 1
+    def get_rebuy_fields(self, product_id: str) -> dict | None:
+        """Just the rebuy-reconcile columns, skipping the full-row fetch."""
+        row = self._read_conn.execute(_SQL_GET_REBUY, (product_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            "rebuy_order_id": row[0],
+            "rebuy_price": _dec(row[1]),
+            "rebuy_size": _dec(row[2]),
+            "anchor_price": _dec(row[3]),
+        }
+
+    def _increment_daily(self, product_id: str, now: float | None = None):
+        row = self.conn.execute(_SQL_GET_DAILY, (product_id,)).fetchone()
+        today = _today()
+        if row is not None and row[0] == today:
+            count = (row[1] or 0) + 1
         else:
             count = 1
-        self.upsert_product_state(
-            product_id, daily_trade_count=count, daily_trade_date=today
-        )
+        self._upsert(product_id, now=now, daily_trade_count=count, daily_trade_date=today)
+
+    def increment_daily_trades(self, product_id: str, now: float | None = None):
+        with self.transaction():
+            self._increment_daily(product_id, now=now)
 
     def get_daily_trade_count(self, product_id: str) -> int:
-        state = self.get_product_state(product_id)
-        if state is None:
-            return 0
-        today = date.today().isoformat()
-        if state["daily_trade_date"] != today:
+        row = self._read_conn.execute(_SQL_GET_DAILY, (product_id,)).fetchone()
+        if row is None or row[0] != _today():
             return 0
-        return state["daily_trade_count"]
+        return row[1] or 0
 
-    def record_trade(
+    def _insert_trade(
         self, product_id: str, side: str, order_type: str, order_id: str,
         price: Decimal, size: Decimal, quote_total: Decimal, fee: Decimal, reason: str,
+        now: float | None = None,
     ):
         self.conn.execute(
-            """INSERT INTO trades
-               (product_id, side, order_type, order_id, price, size, quote_total, fee, reason, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (product_id, side, order_type, order_id, str(price), str(size),
-             str(quote_total), str(fee), reason, time.time()),
+            _SQL_INSERT_TRADE,
+            (product_id, side, order_type, order_id, _enc(price), _enc(size),
+             _enc(quote_total), _enc(fee), reason, time.time() if now is None else now),
         )
-        self.conn.commit()
+
+    def record_trade(
+        self, product_id: str, side: str, order_type: str, order_id: str,
+        price: Decimal, size: Decimal, quote_total: Decimal, fee: Decimal, reason: str,
+        now: float | None = None,
+    ):
+        with self.transaction():
+            self._insert_trade(
+                product_id, side, order_type, order_id, price, size, quote_total, fee, reason,
+                now=now,
+            )
+
+    def record_trades(self, rows: list[tuple], now: float | None = None):
+        """Insert many trades with one executemany under a single commit.
+
+        Each row is (product_id, side, order_type, order_id, price, size,
+        quote_total, fee, reason) with Decimal numerics; all rows share
+        one created_at timestamp.
+        """
+        now = time.time() if now is None else now
+        with self.transaction():
+            self.conn.executemany(
+                _SQL_INSERT_TRADE,
+                [(r[0], r[1], r[2], r[3], _enc(r[4]), _enc(r[5]),
+                  _enc(r[6]), _enc(r[7]), r[8], now) for r in rows],
+            )
+
+    def apply_sell_fill(
+        self, product_id: str, order_id: str, price: Decimal, size: Decimal,
+        quote_total: Decimal, fee: Decimal, reason: str, band_index: int, tp_timestamp: float,
+        now: float | None = None,
+    ):
+        """Record a market sell atomically: trade row, TP band state, daily count.
+
+        One transaction (and so one WAL commit) instead of three.
+        """
+        with self.transaction():
+            self._insert_trade(
+                product_id, "SELL", "market", order_id, price, size, quote_total, fee, reason,
+                now=now,
+            )
+            self._upsert(product_id, now=now, last_tp_band=band_index, last_tp_timestamp=tp_timestamp)
+            self._increment_daily(product_id, now=now)
+
+    def apply_buy_fill(
+        self, product_id: str, order_id: str, price: Decimal, size: Decimal,
+        quote_total: Decimal, fee: Decimal, reason: str, anchor_price: Decimal,
+        now: float | None = None,
+    ):
+        """Record a filled rebuy atomically: trade row, new anchor, cleared rebuy, daily count."""
+        with self.transaction():
+            self._insert_trade(
+                product_id, "BUY", "limit", order_id, price, size, quote_total, fee, reason,
+                now=now,
+            )
+            self._upsert(
+                product_id, now=now, anchor_price=anchor_price,
+                rebuy_order_id=None, rebuy_price=None, rebuy_size=None, rebuy_placed_at=0,
+            )
+            self._increment_daily(product_id, now=now)
 
     def get_recent_trades(self, product_id: str, limit: int = 20) -> list[dict]:
-        rows = self.conn.execute(
-            "SELECT * FROM trades WHERE product_id = ? ORDER BY created_at DESC LIMIT ?",
-            (product_id, limit),
-        ).fetchall()
-        return [dict(r) for r in rows]
+        cur = self._read_conn.execute(_SQL_RECENT_TRADES, (product_id, limit))
+        rows = cur.fetchall()
+        if self._trade_cols is None:
+            self._trade_cols = tuple(d[0] for d in cur.description)
+        cols = self._trade_cols
+        dec = _dec
+        trades = [dict(zip(cols, r)) for r in rows]
+        for t in trades:
+            t["price"] = dec(t["price"])
+            t["size"] = dec(t["size"])
+            t["quote_total"] = dec(t["quote_total"])
+            t["fee"] = dec(t["fee"])
+        return trades
+
+    def checkpoint(self):
+        """Fold the WAL back into the database without blocking readers.
+
+        Called periodically from the runner's idle path so commits never
+        pay for an implicit checkpoint.
+        """
+        self.conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
 
     def close(self):
+        if self._read_conn is not self.conn:
+            self._read_conn.close()
+        if not self._readonly:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
         self.conn.close()